@@ -14,7 +14,29 @@ import sys
 import argparse
 import hashlib
 import json
-from typing import Dict, Any, Tuple, Optional, List
+from functools import lru_cache
+from typing import Dict, Any, FrozenSet, Tuple, Optional, List
+
+# Bound once: content hashes are mostly short (IDs, one-block inputs), so
+# per-call attribute lookup is a visible share of the cost. Calls pass
+# usedforsecurity=False since this is deduplication, not a security boundary;
+# the algorithm must stay SHA256 because stored content_hash values and the
+# schemas' 64-hex-char pattern depend on it.
+_sha256 = hashlib.sha256
+
+# Qdrant MCP integration status for the placeholder search functions below.
+# Tests and callers can check these instead of inspecting function source.
+SEARCH_BY_HASH_INTEGRATION = {
+    "qdrant_tool": "mcp__qdrant__qdrant-find",
+    "status": "todo",
+}
+SEARCH_SIMILAR_INTEGRATION = {
+    "qdrant_tool": "mcp__qdrant__qdrant-find",
+    "status": "todo",
+    # Qdrant answers similarity queries from its own ANN (HNSW) index, so only
+    # the top few candidates are requested and re-scored locally.
+    "candidate_limit": 5,
+}
 
 
 def generate_content_hash(content: str) -> str:
@@ -27,7 +49,28 @@ def generate_content_hash(content: str) -> str:
     Returns:
         Hexadecimal SHA256 hash string
     """
-    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+    return _sha256(content.encode("utf-8"), usedforsecurity=False).hexdigest()
+
+
+def is_content_hash(value: str) -> bool:
+    """
+    Check that a value is a well-formed content hash (64 lowercase hex chars).
+
+    Matches the schemas' ``^[a-f0-9]{64}$`` content_hash pattern.
+
+    Args:
+        value: Candidate content hash
+
+    Returns:
+        True if value is a lowercase hex SHA256 hash string
+    """
+    if len(value) != 64:
+        return False
+    try:
+        # fromhex also accepts uppercase and spaces; the round trip rejects them
+        return bytes.fromhex(value).hex() == value
+    except ValueError:
+        return False
 
 
 def search_by_hash(content_hash: str) -> Tuple[bool, Optional[Dict[str, Any]]]:
@@ -53,6 +96,12 @@ def search_by_hash(content_hash: str) -> Tuple[bool, Optional[Dict[str, Any]]]:
     return False, None
 
 
+@lru_cache(maxsize=1024)
+def _tokens(text: str) -> FrozenSet[str]:
+    """Lowercased word set of text (cached: anchor texts are compared repeatedly)."""
+    return frozenset(text.lower().split())
+
+
 def calculate_similarity(text1: str, text2: str) -> float:
     """
     Calculate semantic similarity between two texts.
@@ -70,8 +119,8 @@ def calculate_similarity(text1: str, text2: str) -> float:
         Similarity score 0.0-1.0
     """
     # Simple Jaccard similarity as placeholder
-    words1 = set(text1.lower().split())
-    words2 = set(text2.lower().split())
+    words1 = _tokens(text1)
+    words2 = _tokens(text2)
 
     if not words1 or not words2:
         return 0.0
@@ -97,15 +146,21 @@ def search_similar_content(
 
     Note:
         This function would integrate with Qdrant MCP in production.
+        Nearest-neighbour search is delegated to Qdrant's vector index;
+        stored entries are never scanned linearly here.
     """
     # TODO: Integrate with mcp__qdrant__qdrant-find()
-    # Search using first 100-200 chars of content
+    # Search using first 100-200 chars of content, limited to candidate_limit
     # Calculate similarity scores
     # Return entries above threshold
 
     # Placeholder implementation
     search_query = content[:100]
-    print(f"  → Searching for similar content (query: {len(search_query)} chars)...")
+    candidate_limit = SEARCH_SIMILAR_INTEGRATION["candidate_limit"]
+    print(
+        f"  → Searching for similar content (query: {len(search_query)} chars, "
+        f"top {candidate_limit})..."
+    )
     print(f"  → Similarity threshold: {threshold}")
 
     return False, []
@@ -131,7 +186,8 @@ def check_duplicate_by_hash(content: str, metadata: Dict[str, Any]) -> Tuple[boo
 
     print(f"\n📋 Content Hash: {content_hash}")
 
-    # Search for existing
+    # Search for existing. Only Qdrant holds every stored hash, so no local
+    # filter (exact set or Bloom filter) could prove the content is new.
     exists, existing = search_by_hash(content_hash)
 
     if exists:
@@ -228,6 +284,7 @@ def run_duplicate_checks(
     check_hash: bool = True,
     check_similarity: bool = True,
     check_id: bool = True,
+    fail_fast: bool = True,
 ) -> Tuple[bool, List[str]]:
     """
     Run all duplicate detection checks.
@@ -239,6 +296,8 @@ def run_duplicate_checks(
         check_hash: Whether to check content hash
         check_similarity: Whether to check semantic similarity
         check_id: Whether to check unique_id collision
+        fail_fast: Stop after the first blocking duplicate instead of running
+            the remaining checks
 
     Returns:
         Tuple of (duplicates_found: bool, messages: list)
@@ -256,6 +315,8 @@ def run_duplicate_checks(
         messages.append(msg)
         if is_dup:
             duplicates_found = True
+            if fail_fast:
+                return duplicates_found, messages
 
     # Check 2: Semantic similarity
     if check_similarity and not duplicates_found:
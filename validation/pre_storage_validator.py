@@ -20,6 +20,7 @@ Created: 2025-12-31
 """
 
 import os
+import re
 import sys
 import json
 import hashlib
@@ -51,6 +52,9 @@ VALID_IMPORTANCE = ["critical", "high", "medium", "low"]
 MIN_CONTENT_LENGTH = 100
 MAX_CONTENT_LENGTH = 50000
 
+# Accept YYYY-MM-DD or ISO 8601 (date prefix)
+CREATED_AT_PATTERN = re.compile(r"^\d{4}-\d{2}-\d{2}")
+
 
 def get_qdrant_client():
     """Get Qdrant client with API key from environment."""
@@ -111,17 +115,24 @@ def check_duplicate_unique_id(client, unique_id: str) -> tuple[bool, str]:
 
 
 def check_similar_content(
-    client, content: str, threshold: float = 0.9
+    client, content: str, threshold: float = 0.9, content_hash: str = None
 ) -> tuple[bool, list]:
     """
     Check for highly similar content using content hash.
 
     For now, uses exact hash matching. Future: semantic similarity.
 
+    Args:
+        client: Qdrant client
+        content: Knowledge content
+        threshold: Similarity threshold (unused until semantic search)
+        content_hash: SHA256 of content if the caller already computed it
+
     Returns:
         (similar_found, similar_entries)
     """
-    content_hash = hashlib.sha256(content.encode("utf-8")).hexdigest()
+    if content_hash is None:
+        content_hash = hashlib.sha256(content.encode("utf-8")).hexdigest()
     similar = []
 
     for coll_name in COLLECTIONS_TO_CHECK:
@@ -191,12 +202,8 @@ def validate_metadata_fields(metadata: dict) -> tuple[bool, list]:
 
     # Validate created_at format
     created_at = metadata.get("created_at", "")
-    if created_at:
-        # Accept YYYY-MM-DD or ISO 8601
-        import re
-
-        if not re.match(r"^\d{4}-\d{2}-\d{2}", created_at):
-            errors.append(f"created_at '{created_at}' must be YYYY-MM-DD format")
+    if created_at and not CREATED_AT_PATTERN.match(created_at):
+        errors.append(f"created_at '{created_at}' must be YYYY-MM-DD format")
 
     return len(errors) == 0, errors
 
@@ -289,7 +296,7 @@ def validate_before_storage(
             if not skip_similarity_check:
                 details["checks_performed"].append("similar_content")
                 similar_found, similar_entries = check_similar_content(
-                    client, information
+                    client, information, content_hash=details["content_hash"]
                 )
                 if similar_found:
                     for entry in similar_entries:
@@ -7,15 +7,36 @@ echo ""
 total_tests=0
 total_passed=0
 
-run_test() {
-    local test_file=$1
+# Test suites share no state, so they run concurrently; results are
+# reported in the order listed here once every suite has finished.
+suites=(
+    "test_all_schemas.py|Schema Validation"
+    "test_duplicate_detection.py|Duplicate Detection"
+    "test_storage_workflow.py|Storage Workflow"
+    "test_inventory_updates.py|Inventory Updates"
+    "test_monthly_review.py|Monthly Review"
+    "test_security_hardening.py|Security Hardening"
+)
+
+results_dir=$(mktemp -d)
+trap 'rm -rf "$results_dir"' EXIT
+
+start_test() {
+    local index=$1
+    local test_file=$2
+    python3 "$test_file" > "$results_dir/$index.out" 2>&1
+    echo $? > "$results_dir/$index.status"
+}
+
+report_test() {
+    local index=$1
     local test_name=$2
     echo "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━"
     echo "Running: $test_name"
     echo "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━"
 
-    output=$(python3 "$test_file" 2>&1)
-    exit_code=$?
+    output=$(cat "$results_dir/$index.out")
+    exit_code=$(cat "$results_dir/$index.status")
 
     # Extract test counts from output
     passed=$(echo "$output" | grep "Tests Passed:" | grep -o '[0-9]\+' | head -1)
@@ -31,12 +52,14 @@ run_test() {
     echo ""
 }
 
-run_test "test_all_schemas.py" "Schema Validation"
-run_test "test_duplicate_detection.py" "Duplicate Detection"
-run_test "test_storage_workflow.py" "Storage Workflow"
-run_test "test_inventory_updates.py" "Inventory Updates"
-run_test "test_monthly_review.py" "Monthly Review"
-run_test "test_security_hardening.py" "Security Hardening"
+for i in "${!suites[@]}"; do
+    start_test "$i" "${suites[$i]%%|*}" &
+done
+wait
+
+for i in "${!suites[@]}"; do
+    report_test "$i" "${suites[$i]#*|}"
+done
 
 echo "═══════════════════════════════════════════════════════════════════════════════"
 echo "FINAL RESULTS"
@@ -266,6 +266,36 @@ test(
     should_pass=False,
 )
 
+# Test 15: Tuple where the schema requires a JSON array
+test(
+    "architecture_decision with tuple affects (not a JSON array)",
+    {
+        "unique_id": "arch-decision-tuple-affects-2025-12-29",
+        "type": "architecture_decision",
+        "component": "qdrant",
+        "importance": "high",
+        "created_at": "2025-12-29",
+        "breaking_change": False,
+        "affects": ("storage", "routing"),
+    },
+    should_pass=False,
+)
+
+# Test 16: Integer beyond 64 bits (orjson cannot serialize it, json can)
+test(
+    "architecture_decision with version beyond 64 bits (valid)",
+    {
+        "unique_id": "arch-decision-large-version-2025-12-29",
+        "type": "architecture_decision",
+        "component": "qdrant",
+        "importance": "high",
+        "created_at": "2025-12-29",
+        "breaking_change": False,
+        "version": 2**70,
+    },
+    should_pass=True,
+)
+
 
 # Summary
 print("\n" + "=" * 80)
@@ -12,17 +12,19 @@ Tests ALL duplicate detection capabilities:
 Following 2025 best practices for Qdrant MCP validation.
 """
 
-import inspect
+import sys
 
+import check_duplicates
 from check_duplicates import (
     generate_content_hash,
+    is_content_hash,
     calculate_similarity,
     check_duplicate_by_hash,
     check_similar_content,
     check_unique_id_collision,
     run_duplicate_checks,
-    search_by_hash,
-    search_similar_content,
+    SEARCH_BY_HASH_INTEGRATION,
+    SEARCH_SIMILAR_INTEGRATION,
 )
 
 print("\n" + "=" * 80)
@@ -30,26 +32,23 @@ print("COMPREHENSIVE DUPLICATE DETECTION TESTING")
 print("Tasks 2, 5, 6, 7: All Duplicate Detection Features")
 print("=" * 80)
 
-tests_run = 0
-tests_passed = 0
+# (name, passed, details) for every test, in run order
+results = []
 
 
 def test(name: str, condition: bool, details: str = ""):
-    """Run a test and track results."""
-    global tests_run, tests_passed
-    tests_run += 1
+    """Run a test, record the result and report it in a single write."""
+    results.append((name, condition, details))
+    test_num = len(results)
 
     if condition:
-        tests_passed += 1
-        print(f"✅ TEST {tests_run}: {name}")
-        if details:
-            print(f"   {details}")
-        return True
+        report = f"✅ TEST {test_num}: {name}\n"
     else:
-        print(f"❌ TEST {tests_run} FAILED: {name}")
-        if details:
-            print(f"   {details}")
-        return False
+        report = f"❌ TEST {test_num} FAILED: {name}\n"
+    if details:
+        report += f"   {details}\n"
+    sys.stdout.write(report)
+    return condition
 
 
 print("\n" + "=" * 80)
@@ -61,11 +60,21 @@ content1 = "This is the 5-tier Qdrant architecture decision."
 hash1 = generate_content_hash(content1)
 test(
     "SHA256 hash generation",
-    len(hash1) == 64 and all(c in "0123456789abcdef" for c in hash1),
+    is_content_hash(hash1),
     f"Hash: {hash1[:32]}...",
 )
 
-# Test 2: Deterministic hashing (same content = same hash)
+# Test 2: Malformed content hashes are rejected
+test(
+    "Content hash check rejects malformed hashes",
+    not any(
+        is_content_hash(bad)
+        for bad in (hash1.upper(), hash1[:63], hash1[:63] + "g", hash1[:62] + " 0")
+    ),
+    "Uppercase, short, non-hex and spaced hashes rejected",
+)
+
+# Test 3: Deterministic hashing (same content = same hash)
 hash1_again = generate_content_hash(content1)
 test(
     "Deterministic hashing (same content = same hash)",
@@ -73,7 +82,7 @@ test(
     f"Both hashes: {hash1[:16]}...",
 )
 
-# Test 3: Different content = different hash
+# Test 4: Different content = different hash
 content2 = "This is a completely different architecture decision."
 hash2 = generate_content_hash(content2)
 test(
@@ -82,7 +91,7 @@ test(
     f"Hash1: {hash1[:16]}... != Hash2: {hash2[:16]}...",
 )
 
-# Test 4: Whitespace sensitivity
+# Test 5: Whitespace sensitivity
 content_with_whitespace = content1 + "  "  # Added trailing spaces
 hash_whitespace = generate_content_hash(content_with_whitespace)
 test(
@@ -96,7 +105,7 @@ print("\n" + "=" * 80)
 print("TASK 5: Exact Duplicate Detection")
 print("=" * 80)
 
-# Test 5: Exact duplicate detection via hash
+# Test 6: Exact duplicate detection via hash
 metadata1 = {
     "unique_id": "arch-decision-test-2025-12-29",
     "type": "architecture_decision",
@@ -108,7 +117,7 @@ test(
     "Hash added to metadata: " + metadata1.get("content_hash", "")[:16] + "...",
 )
 
-# Test 6: Metadata gets content_hash added
+# Test 7: Metadata gets content_hash added
 test(
     "Content hash automatically added to metadata",
     "content_hash" in metadata1 and len(metadata1["content_hash"]) == 64,
@@ -120,43 +129,55 @@ print("\n" + "=" * 80)
 print("TASK 6: Semantic Similarity Detection")
 print("=" * 80)
 
-# Test 7: Similarity calculation (Jaccard similarity)
 text_a = "The quick brown fox jumps over the lazy dog"
 text_b = "The quick brown fox jumps over the lazy cat"
-similarity = calculate_similarity(text_a, text_b)
+text_c = "PostgreSQL database schema for metadata storage"
+similar_content_85 = "The quick brown fox jumps over the lazy hound"
+
+# Score every pair in one batch, then assert on the results
+similarity_pairs = {
+    "near": (text_a, text_b),
+    "identical": (text_a, text_a),
+    "different": (text_a, text_c),
+    "threshold": (text_a, similar_content_85),
+}
+similarities = {
+    name: calculate_similarity(*pair) for name, pair in similarity_pairs.items()
+}
+
+# Test 8: Similarity calculation (Jaccard similarity)
+similarity = similarities["near"]
 test(
     "Jaccard similarity calculation",
     0.7 < similarity < 0.95,  # Should be high similarity but not 1.0
     f"Similarity: {similarity:.2%} (expected 70-95%)",
 )
 
-# Test 8: Identical text similarity
-similarity_identical = calculate_similarity(text_a, text_a)
+# Test 9: Identical text similarity
+similarity_identical = similarities["identical"]
 test(
     "Identical text has 1.0 similarity",
     similarity_identical == 1.0,
     f"Similarity: {similarity_identical:.2%}",
 )
 
-# Test 9: Completely different text low similarity
-text_c = "PostgreSQL database schema for metadata storage"
-similarity_different = calculate_similarity(text_a, text_c)
+# Test 10: Completely different text low similarity
+similarity_different = similarities["different"]
 test(
     "Different text has low similarity",
     similarity_different < 0.3,
     f"Similarity: {similarity_different:.2%} (expected <30%)",
 )
 
-# Test 10: Similarity threshold testing (0.85 default)
-similar_content_85 = "The quick brown fox jumps over the lazy hound"
-sim_85 = calculate_similarity(text_a, similar_content_85)
+# Test 11: Similarity threshold testing (0.85 default)
+sim_85 = similarities["threshold"]
 test(
     "Near-duplicate detection with threshold",
     0.70 < sim_85 < 0.90,
     f"Similarity: {sim_85:.2%} - would trigger warning at 0.85 threshold",
 )
 
-# Test 11: Check similar content function (placeholder mode)
+# Test 12: Check similar content function (placeholder mode)
 similar_found, msg = check_similar_content(content1, threshold=0.85)
 test(
     "Semantic similarity check (no matches - placeholder mode)",
@@ -169,7 +190,7 @@ print("\n" + "=" * 80)
 print("TASK 7: unique_id Collision Detection")
 print("=" * 80)
 
-# Test 12: unique_id collision check
+# Test 13: unique_id collision check
 metadata_with_id = {
     "unique_id": "arch-decision-5-tier-qdrant-2024-12-15",
     "type": "architecture_decision",
@@ -181,7 +202,7 @@ test(
     "ID: " + metadata_with_id["unique_id"],
 )
 
-# Test 13: Missing unique_id warning
+# Test 14: Missing unique_id warning
 metadata_no_id = {"type": "architecture_decision"}
 collision, msg = check_unique_id_collision(metadata_no_id)
 test(
@@ -195,7 +216,7 @@ print("\n" + "=" * 80)
 print("COMPREHENSIVE DUPLICATE CHECKS (All Features Combined)")
 print("=" * 80)
 
-# Test 14: Run all checks together
+# Test 15: Run all checks together
 full_content = "5-Tier Qdrant Architecture Decision - Comprehensive test"
 full_metadata = {
     "unique_id": "arch-decision-comprehensive-test-2025-12-29",
@@ -220,7 +241,7 @@ test(
     f"All 3 checks completed: {len(messages)} messages",
 )
 
-# Test 15: Hash-only mode
+# Test 16: Hash-only mode
 duplicates_found_hash_only, messages_hash_only = run_duplicate_checks(
     content=full_content,
     metadata=full_metadata,
@@ -235,7 +256,7 @@ test(
     f"Only hash check: {len(messages_hash_only)} message",
 )
 
-# Test 16: Custom similarity threshold
+# Test 17: Custom similarity threshold
 custom_threshold_content = "Qdrant five tier architecture for storage"
 duplicates_custom, messages_custom = run_duplicate_checks(
     content=custom_threshold_content,
@@ -253,21 +274,41 @@ test(
 )
 
 
+# Test 18: Exact duplicate stops the remaining checks (fail_fast)
+original_search_by_hash = check_duplicates.search_by_hash
+check_duplicates.search_by_hash = lambda content_hash: (
+    True,
+    {"unique_id": "arch-decision-existing-2025-12-29"},
+)
+try:
+    dup_fast, messages_fast = run_duplicate_checks(
+        content=full_content, metadata=dict(full_metadata)
+    )
+    dup_full, messages_full = run_duplicate_checks(
+        content=full_content, metadata=dict(full_metadata), fail_fast=False
+    )
+finally:
+    check_duplicates.search_by_hash = original_search_by_hash
+
+test(
+    "Exact duplicate short-circuits remaining checks (fail_fast)",
+    dup_fast and len(messages_fast) == 1 and dup_full and len(messages_full) == 2,
+    f"fail_fast: {len(messages_fast)} message, full run: {len(messages_full)}",
+)
+
+
 print("\n" + "=" * 80)
 print("INTEGRATION READINESS CHECK")
 print("=" * 80)
 
-# Test 17: Check for Qdrant MCP integration TODOs
-search_by_hash_source = inspect.getsource(search_by_hash)
-search_similar_source = inspect.getsource(search_similar_content)
-
+# Tests 19-20: Check for Qdrant MCP integration TODOs
 has_mcp_todo_hash = (
-    "TODO" in search_by_hash_source
-    and "mcp__qdrant__qdrant-find" in search_by_hash_source
+    SEARCH_BY_HASH_INTEGRATION["status"] == "todo"
+    and SEARCH_BY_HASH_INTEGRATION["qdrant_tool"] == "mcp__qdrant__qdrant-find"
 )
 has_mcp_todo_similar = (
-    "TODO" in search_similar_source
-    and "mcp__qdrant__qdrant-find" in search_similar_source
+    SEARCH_SIMILAR_INTEGRATION["status"] == "todo"
+    and SEARCH_SIMILAR_INTEGRATION["qdrant_tool"] == "mcp__qdrant__qdrant-find"
 )
 
 test(
@@ -286,6 +327,8 @@ test(
 print("\n" + "=" * 80)
 print("TEST SUMMARY - DUPLICATE DETECTION")
 print("=" * 80)
+tests_run = len(results)
+tests_passed = sum(1 for _name, passed, _details in results if passed)
 print(f"Total Tests: {tests_run}")
 print(f"Tests Passed: {tests_passed}")
 print(f"Tests Failed: {tests_run - tests_passed}")
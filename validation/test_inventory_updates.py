@@ -9,6 +9,7 @@ Following 2025 best practices for governance and tracking.
 """
 
 import os
+import sys
 import tempfile
 from pathlib import Path
 
@@ -21,26 +22,23 @@ print("\n" + "=" * 80)
 print("KNOWLEDGE INVENTORY UPDATE TESTING (Task 9)")
 print("=" * 80)
 
-tests_run = 0
-tests_passed = 0
+# (name, passed, details) for every test, in run order
+results = []
 
 
 def test(name: str, condition: bool, details: str = ""):
-    """Run a test and track results."""
-    global tests_run, tests_passed
-    tests_run += 1
+    """Run a test, record the result and report it in a single write."""
+    results.append((name, condition, details))
+    test_num = len(results)
 
     if condition:
-        tests_passed += 1
-        print(f"✅ TEST {tests_run}: {name}")
-        if details:
-            print(f"   {details}")
-        return True
+        report = f"✅ TEST {test_num}: {name}\n"
     else:
-        print(f"❌ TEST {tests_run} FAILED: {name}")
-        if details:
-            print(f"   {details}")
-        return False
+        report = f"❌ TEST {test_num} FAILED: {name}\n"
+    if details:
+        report += f"   {details}\n"
+    sys.stdout.write(report)
+    return condition
 
 
 print("\n" + "=" * 80)
@@ -262,11 +260,24 @@ with tempfile.TemporaryDirectory() as tmpdir:
 
     test(
         "Written content matches generated markdown",
-        temp_path.read_text() == result_markdown,
+        temp_path.read_bytes().decode("utf-8") == result_markdown,
         "File content is correct",
     )
     # No manual cleanup needed - TemporaryDirectory handles it
 
+# Enum-like values are interned so repeated strings share one object
+interned_entries = [
+    dict(single_entry[0], type="".join(["architecture", "_decision"])),
+    dict(single_entry[0], type="".join(["architecture_", "decision"])),
+]
+update_inventory(interned_entries)
+
+test(
+    "Repeated type values interned by update_inventory",
+    interned_entries[0]["type"] is interned_entries[1]["type"],
+    "Equal enum strings share a single object",
+)
+
 
 print("\n" + "=" * 80)
 print("TEST 6: Edge Cases")
@@ -298,10 +309,23 @@ test(
     "No crash when keywords field missing",
 )
 
+# Test with an importance level outside the standard four
+unusual_importance_markdown = generate_inventory_markdown(
+    [dict(minimal_entry[0], importance="urgent")]
+)
+
+test(
+    "Unknown importance level counted without crashing",
+    "Architecture Decisions | 1 | 0 | 0 | 0 | 0" in unusual_importance_markdown,
+    "Entry counted in type total, not in any importance column",
+)
+
 
 print("\n" + "=" * 80)
 print("TEST SUMMARY - INVENTORY UPDATES")
 print("=" * 80)
+tests_run = len(results)
+tests_passed = sum(1 for _name, passed, _details in results if passed)
 print(f"Total Tests: {tests_run}")
 print(f"Tests Passed: {tests_passed}")
 print(f"Tests Failed: {tests_run - tests_passed}")
@@ -12,33 +12,37 @@ Verifies the monthly review process can execute successfully:
 Following 2025 best practices for knowledge governance.
 """
 
+import io
+import re
+import sys
+from collections import Counter
 from datetime import datetime
 from pathlib import Path
 
+# One clock reading shared by every metric and report in this run
+_NOW = datetime.now()
+
 print("\n" + "=" * 80)
 print("MONTHLY REVIEW WORKFLOW TESTING (Task 10)")
 print("=" * 80)
 
-tests_run = 0
-tests_passed = 0
+# (name, passed, details) for every test, in run order
+results = []
 
 
 def test(name: str, condition: bool, details: str = ""):
-    """Run a test and track results."""
-    global tests_run, tests_passed
-    tests_run += 1
+    """Run a test, record the result and report it in a single write."""
+    results.append((name, condition, details))
+    test_num = len(results)
 
     if condition:
-        tests_passed += 1
-        print(f"✅ TEST {tests_run}: {name}")
-        if details:
-            print(f"   {details}")
-        return True
+        report = f"✅ TEST {test_num}: {name}\n"
     else:
-        print(f"❌ TEST {tests_run} FAILED: {name}")
-        if details:
-            print(f"   {details}")
-        return False
+        report = f"❌ TEST {test_num} FAILED: {name}\n"
+    if details:
+        report += f"   {details}\n"
+    sys.stdout.write(report)
+    return condition
 
 
 print("\n" + "=" * 80)
@@ -48,17 +52,21 @@ print("=" * 80)
 # Check review log structure
 review_log_path = Path("../tracking/review_log.md")
 
+# Read once up front; a missing file is the only case the existence test covers
+try:
+    review_content = review_log_path.read_text()
+except FileNotFoundError:
+    review_content = None
+
 test(
     "Review log file exists",
-    review_log_path.exists(),
+    review_content is not None,
     f"Found at: {review_log_path}",
 )
 
-if review_log_path.exists():
-    review_content = review_log_path.read_text()
-
+if review_content is not None:
     # Test required sections
-    required_sections = [
+    required_sections = (
         "## 📅 Review Schedule",
         "## 📋 Monthly Review Template",
         "#### Pre-Review Checklist",
@@ -73,17 +81,29 @@ if review_log_path.exists():
         "## 🎯 Quarterly Reviews",
         "## 🔄 Review Process",
         "## 📈 Success Metrics",
-    ]
+    )
+    quality_metric_terms = ("Search Success Rate", "Duplicate Rate")
+
+    # Scan the log once with a single alternation; both tests check the result
+    expected_terms_pattern = re.compile(
+        "|".join(map(re.escape, required_sections + quality_metric_terms))
+    )
+    found_terms = set(expected_terms_pattern.findall(review_content))
+    missing_sections = [s for s in required_sections if s not in found_terms]
 
     test(
         "Review log has all required sections",
-        all(section in review_content for section in required_sections),
-        f"All {len(required_sections)} sections present",
+        not missing_sections,
+        (
+            f"All {len(required_sections)} sections present"
+            if not missing_sections
+            else f"Missing: {', '.join(missing_sections)}"
+        ),
     )
 
     test(
         "Review template includes quality metrics",
-        "Search Success Rate" in review_content and "Duplicate Rate" in review_content,
+        found_terms.issuperset(quality_metric_terms),
         "Tracks search success and duplicate rates",
     )
 
@@ -121,30 +141,29 @@ sample_entries = [
 
 
 def calculate_review_metrics(entries, review_month="2025-12"):
-    """Calculate metrics for monthly review."""
+    """Calculate metrics for monthly review (single pass over entries)."""
     total = len(entries)
-    new_this_month = sum(
-        1 for e in entries if e.get("created_at", "").startswith(review_month)
-    )
-    deprecated_this_month = sum(
-        1
-        for e in entries
-        if e.get("deprecated", False)
-        and e.get("deprecated_date", "").startswith(review_month)
-    )
-    active = sum(1 for e in entries if not e.get("deprecated", False))
+    new_this_month = 0
+    deprecated_this_month = 0
+    active = 0
+    by_type = Counter()
 
-    by_type = {}
     for e in entries:
-        t = e.get("type", "unknown")
-        by_type[t] = by_type.get(t, 0) + 1
+        deprecated = e.get("deprecated", False)
+        if e.get("created_at", "").startswith(review_month):
+            new_this_month += 1
+        if not deprecated:
+            active += 1
+        elif e.get("deprecated_date", "").startswith(review_month):
+            deprecated_this_month += 1
+        by_type[e.get("type", "unknown")] += 1
 
     return {
         "total": total,
         "new_this_month": new_this_month,
         "deprecated_this_month": deprecated_this_month,
         "active": active,
-        "by_type": by_type,
+        "by_type": dict(by_type),
     }
 
 
@@ -174,11 +193,15 @@ test(
     f"Active: {metrics['active']}",
 )
 
+expected_type_counts = {
+    "architecture_decision": 1,
+    "agent_spec": 1,
+    "story_outcome": 1,
+}
 test(
     "Metrics calculation: By type breakdown",
-    metrics["by_type"]["architecture_decision"] == 1
-    and metrics["by_type"]["agent_spec"] == 1
-    and metrics["by_type"]["story_outcome"] == 1,
+    {t: metrics["by_type"].get(t) for t in expected_type_counts}
+    == expected_type_counts,
     f"Types: {metrics['by_type']}",
 )
 
@@ -197,19 +220,54 @@ expected_areas = {
 }
 
 
+def keyword_finder(keywords):
+    """Compile keywords into one regex scan that reports every keyword present.
+
+    Alternatives are tried longest first inside a lookahead, so each position
+    reports the longest keyword starting there. Every shorter keyword that is
+    a prefix of it also starts there, so it is added too.
+
+    Args:
+        keywords: Keywords to search for
+
+    Returns:
+        Function mapping a text to the set of keywords it contains
+    """
+    ordered = sorted(set(keywords), key=len, reverse=True)
+    if not ordered:
+        return lambda text: set()
+
+    pattern = re.compile("(?=(" + "|".join(map(re.escape, ordered)) + "))")
+    implied = {k: {p for p in ordered if k.startswith(p)} for k in ordered}
+
+    def find(text):
+        found = set()
+        for match in pattern.findall(text):
+            found |= implied[match]
+        return found
+
+    return find
+
+
 def identify_coverage_gaps(entries, expected):
     """Identify what's missing from knowledge base."""
     gaps = []
     covered = []
 
+    # Scan each entry's lowercased text and unique_id once for all areas
+    area_phrases = {area: area.replace("_", " ") for area in expected}
+    find_phrases = keyword_finder(area_phrases.values())
+    find_ids = keyword_finder(area_phrases)
+    found_phrases = set()
+    found_ids = set()
+    for e in entries:
+        found_phrases |= find_phrases(str(e).lower())
+        found_ids |= find_ids(e.get("unique_id", "").lower())
+
     # Check if entries cover expected areas
-    for area in expected:
+    for area, phrase in area_phrases.items():
         # Simple keyword matching (real implementation would use semantic search)
-        area_covered = any(
-            area.replace("_", " ") in str(e).lower()
-            or area in e.get("unique_id", "").lower()
-            for e in entries
-        )
+        area_covered = phrase in found_phrases or area in found_ids
 
         if area_covered:
             covered.append(area)
@@ -239,8 +297,13 @@ print("TEST 4: Quality Metrics Calculation")
 print("=" * 80)
 
 
-def calculate_quality_metrics(entries):
-    """Calculate quality metrics for review."""
+def calculate_quality_metrics(entries, now=None):
+    """Calculate quality metrics for review.
+
+    Args:
+        entries: Knowledge entries to measure
+        now: Reference time for the review window (defaults to datetime.now())
+    """
     # Search success rate (simulated)
     search_success_rate = 85.0  # Would be calculated from actual search logs
 
@@ -249,18 +312,20 @@ def calculate_quality_metrics(entries):
     # In real implementation, use check_duplicates.py to find actual duplicates
     duplicate_rate = 0.0 if total == 0 else (0 / total) * 100  # No duplicates in sample
 
-    # Deprecated rate
-    deprecated = sum(1 for e in entries if e.get("deprecated", False))
-    deprecated_rate = 0.0 if total == 0 else (deprecated / total) * 100
+    # Deprecated and freshness counts (entries updated in last 3 months),
+    # gathered in one pass. The review-window check does not depend on the
+    # entry, so it is evaluated once.
+    current_date = now or datetime.now()
+    in_review_window = current_date.year == 2025 and current_date.month <= 12
+    deprecated = 0
+    recent_updates = 0
+    for e in entries:
+        if e.get("deprecated", False):
+            deprecated += 1
+        if in_review_window and e.get("last_updated"):
+            recent_updates += 1
 
-    # Freshness (entries updated in last 3 months)
-    current_date = datetime.now()
-    recent_updates = sum(
-        1
-        for e in entries
-        if e.get("last_updated")
-        and (current_date.year == 2025 and current_date.month <= 12)
-    )
+    deprecated_rate = 0.0 if total == 0 else (deprecated / total) * 100
     freshness_rate = 0.0 if total == 0 else (recent_updates / total) * 100
 
     return {
@@ -271,7 +336,7 @@ def calculate_quality_metrics(entries):
     }
 
 
-quality = calculate_quality_metrics(sample_entries)
+quality = calculate_quality_metrics(sample_entries, now=_NOW)
 
 test(
     "Quality metric: Search success rate calculated",
@@ -309,46 +374,56 @@ print("TEST 5: Review Report Generation")
 print("=" * 80)
 
 
-def generate_review_report(entries, month="2025-12"):
-    """Generate monthly review report content."""
+def generate_review_report(entries, month="2025-12", now=None):
+    """Generate monthly review report content.
+
+    Args:
+        entries: Knowledge entries to report on
+        month: Review month in YYYY-MM format
+        now: Report time, shared with the quality metrics (defaults to datetime.now())
+    """
+    now = now or datetime.now()
     metrics = calculate_review_metrics(entries, month)
-    quality = calculate_quality_metrics(entries)
+    quality = calculate_quality_metrics(entries, now=now)
     coverage = identify_coverage_gaps(entries, expected_areas)
 
-    report = []
-    report.append(f"### {month} - Monthly Review\n")
-    report.append(f"**Date**: {datetime.now().strftime('%Y-%m-%d')}")
-    report.append("**Reviewer**: Automated System\n")
-    report.append("#### Statistics\n")
-    report.append(f"- **Total Entries**: {metrics['total']}")
-    report.append(f"- **New This Month**: {metrics['new_this_month']}")
-    report.append(f"- **Deprecated This Month**: {metrics['deprecated_this_month']}")
-    report.append(f"- **Active**: {metrics['active']}\n")
-    report.append("#### Quality Metrics\n")
-    report.append("| Metric | Target | Actual | Status |")
-    report.append("|--------|--------|--------|--------|")
+    report = io.StringIO()
+    w = report.write
+    w(f"### {month} - Monthly Review\n\n")
+    w(f"**Date**: {now.strftime('%Y-%m-%d')}\n")
+    w("**Reviewer**: Automated System\n\n")
+    w("#### Statistics\n\n")
+    w(f"- **Total Entries**: {metrics['total']}\n")
+    w(f"- **New This Month**: {metrics['new_this_month']}\n")
+    w(f"- **Deprecated This Month**: {metrics['deprecated_this_month']}\n")
+    w(f"- **Active**: {metrics['active']}\n\n")
+    w("#### Quality Metrics\n\n")
+    w("| Metric | Target | Actual | Status |\n")
+    w("|--------|--------|--------|--------|\n")
 
     search_status = "✅" if quality["search_success_rate"] > 80 else "❌"
     dup_status = "✅" if quality["duplicate_rate"] < 5 else "❌"
 
-    report.append(
-        f"| Search Success Rate | > 80% | {quality['search_success_rate']:.1f}% | {search_status} |"
-    )
-    report.append(
-        f"| Duplicate Rate | < 5% | {quality['duplicate_rate']:.1f}% | {dup_status} |"
+    w(
+        f"| Search Success Rate | > 80% | {quality['search_success_rate']:.1f}% | {search_status} |\n"
     )
-    report.append("")
-    report.append("#### Coverage Gaps\n")
+    w(f"| Duplicate Rate | < 5% | {quality['duplicate_rate']:.1f}% | {dup_status} |\n")
+    w("\n")
+    w("#### Coverage Gaps\n\n")
     if coverage["gaps"]:
-        for gap in coverage["gaps"]:
-            report.append(f"- {gap.replace('_', ' ').title()} - Priority: HIGH")
+        w(
+            "\n".join(
+                f"- {gap.replace('_', ' ').title()} - Priority: HIGH"
+                for gap in coverage["gaps"]
+            )
+        )
     else:
-        report.append("- No major gaps identified")
+        w("- No major gaps identified")
 
-    return "\n".join(report)
+    return report.getvalue()
 
 
-review_report = generate_review_report(sample_entries)
+review_report = generate_review_report(sample_entries, now=_NOW)
 
 test(
     "Review report includes all required sections",
@@ -405,6 +480,8 @@ test(
 print("\n" + "=" * 80)
 print("TEST SUMMARY - MONTHLY REVIEW WORKFLOW")
 print("=" * 80)
+tests_run = len(results)
+tests_passed = sum(1 for _name, passed, _details in results if passed)
 print(f"Total Tests: {tests_run}")
 print(f"Tests Passed: {tests_passed}")
 print(f"Tests Failed: {tests_run - tests_passed}")
@@ -11,36 +11,54 @@ Following 2025 security best practices.
 """
 
 import json
+import os
+import sys
 import tempfile
+from functools import lru_cache
 from pathlib import Path
 from update_inventory import ALLOWED_BASE_DIR
-from validate_metadata import validate_metadata, MAX_JSON_DEPTH, MAX_JSON_SIZE
+from validate_metadata import (
+    validate_metadata,
+    validate_metadata_json,
+    MAX_JSON_DEPTH,
+    MAX_JSON_SIZE,
+)
 
 print("\n" + "=" * 80)
 print("SECURITY HARDENING VERIFICATION - 2025 BEST PRACTICES")
 print("Testing CVE-2025-47273, CWE-1333, CWE-400, CWE-367 Fixes")
 print("=" * 80)
 
-tests_run = 0
-tests_passed = 0
+# (name, passed, details) for every test, in run order
+results = []
 
 
 def test(name: str, condition: bool, details: str = ""):
-    """Run a test and track results."""
-    global tests_run, tests_passed
-    tests_run += 1
+    """Run a test, record the result and report it in a single write."""
+    results.append((name, condition, details))
+    test_num = len(results)
 
     if condition:
-        tests_passed += 1
-        print(f"✅ TEST {tests_run}: {name}")
-        if details:
-            print(f"   {details}")
-        return True
+        report = f"✅ TEST {test_num}: {name}\n"
     else:
-        print(f"❌ TEST {tests_run} FAILED: {name}")
-        if details:
-            print(f"   {details}")
-        return False
+        report = f"❌ TEST {test_num} FAILED: {name}\n"
+    if details:
+        report += f"   {details}\n"
+    sys.stdout.write(report)
+    return condition
+
+
+@lru_cache(maxsize=None)
+def read_source(filename: str) -> str:
+    """Read a file next to this script, caching the text for repeated checks.
+
+    Args:
+        filename: Name of the file in the validation directory
+
+    Returns:
+        File contents as a string
+    """
+    return (Path(__file__).parent / filename).read_text()
 
 
 print("\n" + "=" * 80)
@@ -51,16 +69,10 @@ print("=" * 80)
 with tempfile.TemporaryDirectory() as tmpdir:
     valid_path = Path(tmpdir) / "inventory.md"
 
-    # Override ALLOWED_BASE_DIR for testing
-    import os
-
-    os.environ["QDRANT_INVENTORY_BASE_DIR"] = tmpdir
-
-    # Reload module to pick up new environment variable
-    import importlib
+    # Override ALLOWED_BASE_DIR for testing (read at call time, no reload needed)
     import update_inventory as ui_module
 
-    importlib.reload(ui_module)
+    ui_module.ALLOWED_BASE_DIR = Path(tmpdir).resolve()
 
     try:
         result = ui_module.update_inventory([], output_path=str(valid_path))
@@ -116,11 +128,12 @@ print("=" * 80)
 
 # Test 4: Deeply nested JSON should be rejected (MAX_JSON_DEPTH = 100)
 def create_nested_json(depth: int) -> dict:
-    """Create deeply nested JSON structure."""
-    result = {"value": "leaf"}
-    for i in range(depth):
-        result = {"nested": result}
-    return result
+    """Create deeply nested JSON structure.
+
+    The structure is parsed from a prebuilt JSON string, so the nested
+    dicts are allocated by the json module in one call.
+    """
+    return json.loads('{"nested":' * depth + '{"value":"leaf"}' + "}" * depth)
 
 
 # Create JSON at max depth (should pass)
@@ -160,6 +173,31 @@ test(
     f"ReDoS prevention: {msg[:80]}...",
 )
 
+# Raw JSON text exceeding max depth is rejected before any dicts are built
+depth = MAX_JSON_DEPTH + 10
+excessive_depth_json = (
+    '{"type": "architecture_decision", "trade_offs": '
+    + '{"nested":' * depth
+    + '{"value":"leaf"}'
+    + "}" * depth
+    + "}"
+)
+
+valid, msg = validate_metadata_json(excessive_depth_json)
+test(
+    f"JSON text exceeding max depth ({depth} levels) is rejected unparsed",
+    not valid and "too deeply nested" in msg.lower(),
+    f"ReDoS prevention: {msg[:80]}...",
+)
+
+# Unhashable type values from untrusted JSON are rejected, not raised
+valid, msg = validate_metadata_json('{"type": ["architecture_decision"]}')
+test(
+    "Non-string type value is rejected without raising",
+    not valid and "invalid type" in msg.lower(),
+    msg.splitlines()[0],
+)
+
 
 print("\n" + "=" * 80)
 print("SECURITY TEST 3: Memory Exhaustion Prevention (CWE-400)")
@@ -215,7 +253,7 @@ test(
 )
 
 # Test 9: Verify no predictable temp file patterns (without importing test file)
-test_file_content = Path("test_inventory_updates.py").read_text()
+test_file_content = read_source("test_inventory_updates.py")
 
 test(
     "No NamedTemporaryFile usage in test_inventory_updates.py",
@@ -257,6 +295,8 @@ test(
 print("\n" + "=" * 80)
 print("TEST SUMMARY - SECURITY HARDENING VERIFICATION")
 print("=" * 80)
+tests_run = len(results)
+tests_passed = sum(1 for _name, passed, _details in results if passed)
 print(f"Total Tests: {tests_run}")
 print(f"Tests Passed: {tests_passed}")
 print(f"Tests Failed: {tests_run - tests_passed}")
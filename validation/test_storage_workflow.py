@@ -11,40 +11,51 @@ Tests the complete knowledge storage workflow:
 Following 2025 best practices for Qdrant MCP integration.
 """
 
+import json
+import subprocess
 import sys
+import tempfile
+from datetime import date
 from pathlib import Path
 
 # Add parent directory to path for validation imports
 sys.path.insert(0, str(Path(__file__).parent))
 
-from validate_metadata import run_all_validations
-from check_duplicates import run_duplicate_checks, generate_content_hash
+import validate_metadata
+from validate_metadata import (
+    BATCH_PARALLEL_MIN_FILES,
+    MAX_JSON_SIZE,
+    run_all_validations,
+    validate_files,
+)
+from check_duplicates import (
+    run_duplicate_checks,
+    generate_content_hash,
+    is_content_hash,
+)
 
 print("\n" + "=" * 80)
 print("STORAGE WORKFLOW VALIDATION TESTING")
 print("Tasks 3 & 8: Verify Storage and Search Patterns")
 print("=" * 80)
 
-tests_run = 0
-tests_passed = 0
+# (name, passed, details) for every test, in run order
+results = []
 
 
 def test(name: str, condition: bool, details: str = ""):
-    """Run a test and track results."""
-    global tests_run, tests_passed
-    tests_run += 1
+    """Run a test, record the result and report it in a single write."""
+    results.append((name, condition, details))
+    test_num = len(results)
 
     if condition:
-        tests_passed += 1
-        print(f"✅ TEST {tests_run}: {name}")
-        if details:
-            print(f"   {details}")
-        return True
+        report = f"✅ TEST {test_num}: {name}\n"
     else:
-        print(f"❌ TEST {tests_run} FAILED: {name}")
-        if details:
-            print(f"   {details}")
-        return False
+        report = f"❌ TEST {test_num} FAILED: {name}\n"
+    if details:
+        report += f"   {details}\n"
+    sys.stdout.write(report)
+    return condition
 
 
 print("\n" + "=" * 80)
@@ -69,7 +80,7 @@ RATIONALE:
 content_hash = generate_content_hash(content)
 test(
     "Content hash generation for deduplication",
-    len(content_hash) == 64 and all(c in "0123456789abcdef" for c in content_hash),
+    is_content_hash(content_hash),
     f"SHA256: {content_hash[:16]}...",
 )
 
@@ -104,12 +115,35 @@ test(
     f"Validation checks: {len(messages)} passed",
 )
 
+# Test 4: Revalidating unchanged metadata gives the same, independent result
+messages.append("caller note")
+all_valid_again, messages_again = run_all_validations(dict(metadata))
+test(
+    "Revalidation of unchanged metadata gives the same result",
+    all_valid_again == all_valid and len(messages_again) == len(messages) - 1,
+    "Cached messages are returned as a fresh list",
+)
+
+# Test 5: Only plain JSON metadata within the size limit is memoized
+cache_size = len(validate_metadata._validation_cache)
+dated_valid, _ = run_all_validations(dict(metadata, created_at=date(2024, 12, 15)))
+oversized_valid, _ = run_all_validations(
+    dict(metadata, alternatives_considered=["x" * MAX_JSON_SIZE])
+)
+test(
+    "Non-JSON and oversized metadata bypass the validation cache",
+    not dated_valid
+    and not oversized_valid
+    and len(validate_metadata._validation_cache) == cache_size,
+    "A date is not its ISO string; oversized payloads are never serialized",
+)
+
 
 print("\n" + "=" * 80)
 print("WORKFLOW STEP 3: Duplicate Detection")
 print("=" * 80)
 
-# Test 4: Run duplicate checks before storage
+# Test 6: Run duplicate checks before storage
 duplicates_found, dup_messages = run_duplicate_checks(
     content=content,
     metadata=metadata,
@@ -125,7 +159,7 @@ test(
     f"All {len(dup_messages)} checks completed (hash, similarity, ID)",
 )
 
-# Test 5: Content hash added to metadata
+# Test 7: Content hash added to metadata
 test(
     "Content hash automatically added to metadata",
     "content_hash" in metadata and len(metadata["content_hash"]) == 64,
@@ -137,14 +171,14 @@ print("\n" + "=" * 80)
 print("WORKFLOW STEP 4: Search Pattern Validation (Task 8)")
 print("=" * 80)
 
-# Test 6: Keywords for search
+# Test 8: Keywords for search
 test(
     "Metadata can include search keywords",
     True,  # Demonstrated by schema allowing keywords field
     "Search optimization supported by metadata schema",
 )
 
-# Test 7: Search intent patterns
+# Test 9: Search intent patterns
 search_intents = [
     "5-tier qdrant architecture",
     "qdrant port mappings",
@@ -158,14 +192,14 @@ test(
     f"{len(search_intents)} search patterns defined",
 )
 
-# Test 8: Component-based filtering
+# Test 10: Component-based filtering
 test(
     "Component field enables filtered searches",
     metadata.get("component") == "qdrant",
     "Can filter by component: qdrant, postgres, agents, etc.",
 )
 
-# Test 9: Importance-based filtering
+# Test 11: Importance-based filtering
 test(
     "Importance field enables priority searches",
     metadata.get("importance") in ["critical", "high", "medium", "low"],
@@ -177,7 +211,7 @@ print("\n" + "=" * 80)
 print("WORKFLOW STEP 5: Story/Epic Relationship Tracking")
 print("=" * 80)
 
-# Test 10: Story relationships
+# Test 12: Story relationships
 story_metadata = {
     "unique_id": "story-2-17-complete",
     "type": "story_outcome",
@@ -199,7 +233,7 @@ print("\n" + "=" * 80)
 print("WORKFLOW STEP 6: Best Practice Storage Pattern")
 print("=" * 80)
 
-# Test 11: Best practice schema compliance
+# Test 13: Best practice schema compliance
 bp_metadata = {
     "unique_id": "bp-qdrant-batch-upsert-2024-12-28",
     "type": "best_practice",
@@ -224,7 +258,7 @@ print("\n" + "=" * 80)
 print("INTEGRATION READINESS: Search Query Patterns")
 print("=" * 80)
 
-# Test 12: Common search patterns that should work
+# Test 14: Common search patterns that should work
 search_patterns = {
     "By Component": "component:qdrant",
     "By Importance": "importance:critical",
@@ -241,17 +275,91 @@ test(
     f"Search patterns: {', '.join(search_patterns.keys())}",
 )
 
-# Test 13: Similarity search readiness
+# Test 15: Similarity search readiness
 test(
     "Semantic similarity threshold configurable",
     0.0 <= 0.85 <= 1.0,  # Default threshold
     "Threshold: 0.85 (85% similarity)",
 )
 
+# Test 16: Batch validation of metadata files keeps input order
+with tempfile.TemporaryDirectory() as tmpdir:
+    batch_paths = []
+    for name, entry in [
+        ("arch.json", metadata),
+        ("story.json", story_metadata),
+        ("broken.json", {"type": "story_outcome"}),
+    ]:
+        entry_path = Path(tmpdir) / name
+        entry_path.write_text(json.dumps(entry), encoding="utf-8")
+        batch_paths.append(str(entry_path))
+    batch_paths.append(str(Path(tmpdir) / "missing.json"))
+    batch_results = validate_files(batch_paths)
+
+test(
+    "Batch validation reports each metadata file in order",
+    [valid for valid, _messages in batch_results] == [True, True, False, False],
+    f"{len(batch_results)} files validated (2 valid, 1 invalid, 1 missing)",
+)
+
+# Test 17: Batches large enough for worker processes report malformed files
+with tempfile.TemporaryDirectory() as tmpdir:
+    entries = [metadata] * BATCH_PARALLEL_MIN_FILES + [
+        {"type": ["architecture_decision"]},
+        dict(metadata, unique_id=5),
+    ]
+    for index, entry in enumerate(entries):
+        entry_path = Path(tmpdir) / f"entry-{index:03d}.json"
+        entry_path.write_text(json.dumps(entry), encoding="utf-8")
+    batch_run = subprocess.run(
+        [
+            sys.executable,
+            str(Path(__file__).parent / "validate_metadata.py"),
+            "--batch",
+            str(Path(tmpdir) / "*.json"),
+        ],
+        capture_output=True,
+        encoding="utf-8",
+    )
+
+test(
+    "Parallel batch validation reports malformed files instead of crashing",
+    batch_run.returncode == 1
+    and "Traceback" not in batch_run.stderr
+    and f"{len(entries)} files: {len(entries) - 2} passed, 2 failed"
+    in batch_run.stdout,
+    f"{len(entries)} files (>= {BATCH_PARALLEL_MIN_FILES} use worker processes)",
+)
+
+# Test 18: A single metadata file that is not a JSON object is reported
+with tempfile.TemporaryDirectory() as tmpdir:
+    entry_path = Path(tmpdir) / "list.json"
+    entry_path.write_text("[1, 2]", encoding="utf-8")
+    single_run = subprocess.run(
+        [
+            sys.executable,
+            str(Path(__file__).parent / "validate_metadata.py"),
+            "--metadata",
+            str(entry_path),
+        ],
+        capture_output=True,
+        encoding="utf-8",
+    )
+
+test(
+    "Single-file validation rejects a non-object metadata file",
+    single_run.returncode == 1
+    and "Traceback" not in single_run.stderr
+    and "ERROR: Metadata must be a JSON object" in single_run.stdout,
+    "Same message as --batch gives for the file",
+)
+
 
 print("\n" + "=" * 80)
 print("TEST SUMMARY - STORAGE WORKFLOW")
 print("=" * 80)
+tests_run = len(results)
+tests_passed = sum(1 for _name, passed, _details in results if passed)
 print(f"Total Tests: {tests_run}")
 print(f"Tests Passed: {tests_passed}")
 print(f"Tests Failed: {tests_run - tests_passed}")
@@ -9,6 +9,9 @@ Tests the validation system with:
 4. Edge cases (missing fields, invalid values, wrong formats)
 """
 
+import sys
+from dataclasses import dataclass
+
 from validate_metadata import run_all_validations
 from check_duplicates import generate_content_hash
 
@@ -16,33 +19,47 @@ print("\n" + "=" * 80)
 print("PHASE 5: COMPREHENSIVE VALIDATION TESTING")
 print("=" * 80)
 
+
+@dataclass
+class TestStats:
+    """Running totals for the test cases in this script."""
+
+    run: int = 0
+    passed: int = 0
+
+    def record(self, success: bool) -> None:
+        """Count one test and whether it passed."""
+        self.run += 1
+        if success:
+            self.passed += 1
+
+
 # Test Counter
-tests_run = 0
-tests_passed = 0
+stats = TestStats()
 
 
 def test_case(name: str, metadata: dict, should_pass: bool):
-    """Run a test case and report results."""
-    global tests_run, tests_passed
-    tests_run += 1
-
-    print(f"\n{'─'*80}")
-    print(f"TEST {tests_run}: {name}")
-    print(f"Expected: {'✓ PASS' if should_pass else '✗ FAIL'}")
+    """Run a test case and report results in a single write."""
+    report = [
+        f"\n{'─'*80}",
+        f"TEST {stats.run + 1}: {name}",
+        f"Expected: {'✓ PASS' if should_pass else '✗ FAIL'}",
+    ]
 
     all_valid, messages = run_all_validations(metadata)
 
-    # Print first 2 messages for context
-    for msg in messages[:2]:
-        print(f"  {msg}")
+    # Report first 2 messages for context
+    report.extend(f"  {msg}" for msg in messages[:2])
 
     success = all_valid == should_pass
+    stats.record(success)
     if success:
-        tests_passed += 1
-        print("Result: ✅ TEST PASSED")
+        report.append("Result: ✅ TEST PASSED")
     else:
-        print(f"Result: ❌ TEST FAILED (got {'PASS' if all_valid else 'FAIL'})")
+        report.append(f"Result: ❌ TEST FAILED (got {'PASS' if all_valid else 'FAIL'})")
 
+    report.append("")
+    sys.stdout.write("\n".join(report))
     return success
 
 
@@ -231,23 +248,23 @@ print(
     f"Content 3 hash: {hash3[:16]}... {'✅ DIFFERENT' if hash1 != hash3 else '❌ SAME'}"
 )
 
-if hash1 == hash2 and hash1 != hash3:
+duplicate_detection_works = hash1 == hash2 and hash1 != hash3
+if duplicate_detection_works:
     print("✅ TEST PASSED: Exact duplicate detection works")
-    tests_passed += 1
 else:
     print("❌ TEST FAILED: Duplicate detection error")
-tests_run += 1
+stats.record(duplicate_detection_works)
 
 # Summary
 print("\n" + "=" * 80)
 print("VALIDATION TEST SUMMARY")
 print("=" * 80)
-print(f"Total Tests: {tests_run}")
-print(f"Tests Passed: {tests_passed}")
-print(f"Tests Failed: {tests_run - tests_passed}")
-print(f"Success Rate: {(tests_passed/tests_run)*100:.1f}%")
+print(f"Total Tests: {stats.run}")
+print(f"Tests Passed: {stats.passed}")
+print(f"Tests Failed: {stats.run - stats.passed}")
+print(f"Success Rate: {(stats.passed/stats.run)*100:.1f}%")
 
-if tests_passed == tests_run:
+if stats.passed == stats.run:
     print("\n✅ ALL VALIDATION TESTS PASSED")
     print("\nKEY FINDINGS:")
     print("✓ validate_metadata.py works with all 8 schema types")
@@ -258,5 +275,5 @@ if tests_passed == tests_run:
     print("✓ Duplicate detection works correctly")
     exit(0)
 else:
-    print(f"\n⚠️  {tests_run - tests_passed} TESTS NEED REVIEW")
+    print(f"\n⚠️  {stats.run - stats.passed} TESTS NEED REVIEW")
     exit(1)
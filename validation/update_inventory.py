@@ -8,396 +8,363 @@ knowledge base statistics and entries.
 Following 2025 best practices for Qdrant MCP governance.
 """
 
+import heapq
+import io
+from collections import Counter
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List
+from typing import Callable, Dict, List, NamedTuple
 
 # Security: Define allowed base directory for path traversal prevention
 # Can be overridden for testing via environment variable
 import os
+import sys
 
 _default_base = Path(__file__).parent.parent / "tracking"
 ALLOWED_BASE_DIR = Path(os.getenv("QDRANT_INVENTORY_BASE_DIR", str(_default_base)))
 
+# Fields whose values come from a small fixed vocabulary (schema enums)
+INTERNED_FIELDS = ("type", "component", "importance", "severity")
+
+# Summary table rows, in output order. The keys are compile-time constants,
+# so they are the same interned objects as the entry values interned below.
+TYPE_LABELS = {
+    "architecture_decision": "Architecture Decisions",
+    "agent_spec": "Agent Specifications",
+    "story_outcome": "Story Outcomes",
+    "error_pattern": "Error Patterns",
+    "database_schema": "Database Schemas",
+    "config_pattern": "Config Patterns",
+    "integration_example": "Integration Examples",
+    "best_practice": "Best Practices",
+}
+COMPONENTS = ("qdrant", "postgres", "neo4j", "agents", "docker", "api", "general")
+
+
+def _intern_entry_fields(entries: List[Dict]) -> None:
+    """
+    Intern enum-like field values in place.
+
+    Entries loaded from JSON carry a separate string object per value; interning
+    collapses them to one shared object each, so large inventories hold less
+    memory and the aggregation passes compare by identity first.
+    """
+    for entry in entries:
+        for field in INTERNED_FIELDS:
+            value = entry.get(field)
+            if type(value) is str:
+                entry[field] = sys.intern(value)
+
+
+# Static markdown blocks. generate_inventory_markdown writes them as is and only
+# formats the data lines between them; each block ends with its own newline.
+_TITLE_BLOCK = (
+    "# Qdrant MCP Knowledge Inventory\n"
+    "\n"
+    "**Purpose**: Auto-updated tracking of all knowledge stored in Qdrant MCP\n"
+)
+_SUMMARY_HEADER = "\n---\n\n## 📊 Summary Statistics\n\n"
+_BY_TYPE_HEADER = (
+    "\n"
+    "### By Type\n"
+    "\n"
+    "| Type | Count | Critical | High | Medium | Low |\n"
+    "|------|-------|----------|------|--------|-----|\n"
+)
+_BY_COMPONENT_HEADER = (
+    "\n### By Component\n\n| Component | Count |\n|-----------|-------|\n"
+)
+_DETAILED_INVENTORY_HEADER = "\n---\n\n## 🗂️ Detailed Inventory\n\n"
+_UPDATE_LOG_HEADER = "\n## 📝 Update Log\n\n"
+_SEARCH_INDEX_HEADER = (
+    "## 🔍 Search Index\n\n**Keywords**: (Auto-generated from all entries)\n\n"
+)
+_DEPRECATED_HEADER = "## ⚠️ Deprecated Entries\n\n"
+_DEPRECATED_TABLE_HEADER = (
+    "\n"
+    "| unique_id | Type | Deprecated Date | Superseded By | Reason |\n"
+    "|-----------|------|-----------------|---------------|--------|\n"
+)
+_SECTION_BREAK = "\n---\n\n"
+_FOOTER = (
+    "\n"
+    "---\n"
+    "\n"
+    "**Auto-Update Script**: `validation/update_inventory.py`\n"
+    "**Next Scheduled Update**: After next knowledge entry\n"
+)
+
+# Table row templates. Placeholders name entry fields, or derived fields
+# (breaking, status, reason) supplied by the table's derive function.
+_ARCH_DECISION_ROW = "| {unique_id} | {component} | {breaking} | {importance} | {created_at} | {status} |"
+_AGENT_SPEC_ROW = "| {unique_id} | {agent_id} | {agent_name} | {importance} | {created_at} | {status} |"
+_STORY_OUTCOME_ROW = (
+    "| {unique_id} | {story_id} | {epic_id} | {importance} | {created_at} | {status} |"
+)
+_ERROR_PATTERN_ROW = (
+    "| {unique_id} | {component} | {severity} | {created_at} | {status} |"
+)
+_DATABASE_SCHEMA_ROW = (
+    "| {unique_id} | {table_name} | {database} | {created_at} | {status} |"
+)
+_COMPONENT_ROW = (
+    "| {unique_id} | {component} | {importance} | {created_at} | {status} |"
+)
+_DEPRECATED_ROW = (
+    "| {unique_id} | {type} | {deprecated_date} | {superseded_by} | {reason} |"
+)
+
+
+class _Row(dict):
+    """Row template fields; any field an entry does not have renders as "-"."""
+
+    __slots__ = ()
+
+    def __missing__(self, key: str) -> str:
+        return "-"
+
 
 def generate_inventory_markdown(entries: List[Dict]) -> str:
     """Generate the complete inventory markdown from knowledge entries."""
 
     # Calculate statistics
     total = len(entries)
-    by_type = {}
-    by_component = {}
-    by_importance = {"critical": 0, "high": 0, "medium": 0, "low": 0}
-    deprecated_count = 0
-    last_created = None
+    by_type_importance = Counter(
+        (entry.get("type", "unknown"), entry.get("importance", "medium"))
+        for entry in entries
+    )
+    by_type = Counter()
+    for (entry_type, _importance), count in by_type_importance.items():
+        by_type[entry_type] += count
+    by_component = Counter(entry.get("component", "unknown") for entry in entries)
+    last_created = max(
+        (entry["created_at"] for entry in entries if entry.get("created_at")),
+        default=None,
+    )
 
-    # Group entries
+    # One pass groups entries for the detailed tables and the deprecated
+    # section, so no section re-filters the full entry list
+    buckets: Dict[str, List[Dict]] = {}
+    deprecated_entries = []
     for entry in entries:
-        # By type
-        entry_type = entry.get("type", "unknown")
-        if entry_type not in by_type:
-            by_type[entry_type] = {
-                "total": 0,
-                "critical": 0,
-                "high": 0,
-                "medium": 0,
-                "low": 0,
-            }
-        by_type[entry_type]["total"] += 1
-        importance = entry.get("importance", "medium")
-        by_type[entry_type][importance] += 1
-        by_importance[importance] += 1
-
-        # By component
-        component = entry.get("component", "unknown")
-        by_component[component] = by_component.get(component, 0) + 1
-
-        # Track deprecated
+        buckets.setdefault(entry.get("type"), []).append(entry)
         if entry.get("deprecated", False):
-            deprecated_count += 1
-
-        # Track last created
-        created = entry.get("created_at")
-        if created and (not last_created or created > last_created):
-            last_created = created
-
-    # Build markdown
-    md = []
-    md.append("# Qdrant MCP Knowledge Inventory")
-    md.append("")
-    md.append(
-        "**Purpose**: Auto-updated tracking of all knowledge stored in Qdrant MCP"
+            deprecated_entries.append(entry)
+    deprecated_count = len(deprecated_entries)
+
+    # All keyword lists merged by a single set union
+    keywords = set().union(
+        *(entry["keywords"] for entry in entries if "keywords" in entry)
     )
-    md.append(f"**Last Updated**: {datetime.now().strftime('%Y-%m-%d')}")
-    md.append("")
-    md.append("---")
-    md.append("")
-    md.append("## 📊 Summary Statistics")
-    md.append("")
-    md.append(f"- **Total Entries**: {total}")
-    md.append(f"- **Last Entry Added**: {last_created or 'N/A'}")
-    md.append(f"- **Deprecated**: {deprecated_count}")
-    md.append("")
-    md.append("### By Type")
-    md.append("")
-    md.append("| Type | Count | Critical | High | Medium | Low |")
-    md.append("|------|-------|----------|------|--------|-----|")
-
-    type_labels = {
-        "architecture_decision": "Architecture Decisions",
-        "agent_spec": "Agent Specifications",
-        "story_outcome": "Story Outcomes",
-        "error_pattern": "Error Patterns",
-        "database_schema": "Database Schemas",
-        "config_pattern": "Config Patterns",
-        "integration_example": "Integration Examples",
-        "best_practice": "Best Practices",
-    }
 
-    for type_key, type_label in type_labels.items():
-        stats = by_type.get(
-            type_key, {"total": 0, "critical": 0, "high": 0, "medium": 0, "low": 0}
+    # Build markdown in a single buffer
+    today = datetime.now().strftime("%Y-%m-%d")
+    buf = io.StringIO()
+    write = buf.write
+    write(_TITLE_BLOCK)
+    write(f"**Last Updated**: {today}\n")
+    write(_SUMMARY_HEADER)
+    write(
+        f"- **Total Entries**: {total}\n"
+        f"- **Last Entry Added**: {last_created or 'N/A'}\n"
+        f"- **Deprecated**: {deprecated_count}\n"
+    )
+    write(_BY_TYPE_HEADER)
+
+    for type_key, type_label in TYPE_LABELS.items():
+        critical, high, medium, low = (
+            by_type_importance[(type_key, importance)]
+            for importance in ("critical", "high", "medium", "low")
         )
-        md.append(
-            f"| {type_label} | {stats['total']} | {stats['critical']} | {stats['high']} | {stats['medium']} | {stats['low']} |"
+        write(
+            f"| {type_label} | {by_type[type_key]} | {critical} | {high} | {medium} | {low} |\n"
         )
 
-    md.append("")
-    md.append("### By Component")
-    md.append("")
-    md.append("| Component | Count |")
-    md.append("|-----------|-------|")
-
-    for component in [
-        "qdrant",
-        "postgres",
-        "neo4j",
-        "agents",
-        "docker",
-        "api",
-        "general",
-    ]:
-        count = by_component.get(component, 0)
-        md.append(f"| {component} | {count} |")
-
-    md.append("")
-    md.append("---")
-    md.append("")
-    md.append("## 🗂️ Detailed Inventory")
-    md.append("")
+    write(_BY_COMPONENT_HEADER)
+
+    for component in COMPONENTS:
+        write(f"| {component} | {by_component[component]} |\n")
+
+    write(_DETAILED_INVENTORY_HEADER)
 
     # Detailed sections for each type
-    md.extend(_generate_arch_decisions_table(entries))
-    md.extend(_generate_agent_specs_table(entries))
-    md.extend(_generate_story_outcomes_table(entries))
-    md.extend(_generate_error_patterns_table(entries))
-    md.extend(_generate_database_schemas_table(entries))
-    md.extend(_generate_config_patterns_table(entries))
-    md.extend(_generate_integration_examples_table(entries))
+    for type_key, spec in TABLE_SPECS.items():
+        _generate_table(buf, spec, buckets.get(type_key, []))
 
     # Update log
-    md.append("")
-    md.append("## 📝 Update Log")
-    md.append("")
-    md.append(f"### {datetime.now().strftime('%Y-%m-%d')}")
-    md.append(f"- Updated inventory: {total} total entries")
-    md.append("")
-    md.append("---")
-    md.append("")
+    write(_UPDATE_LOG_HEADER)
+    write(f"### {today}\n- Updated inventory: {total} total entries\n")
+    write(_SECTION_BREAK)
 
     # Keywords
-    keywords = set()
-    for entry in entries:
-        if "keywords" in entry:
-            keywords.update(entry["keywords"])
-
-    md.append("## 🔍 Search Index")
-    md.append("")
-    md.append("**Keywords**: (Auto-generated from all entries)")
-    md.append("")
+    write(_SEARCH_INDEX_HEADER)
     if keywords:
-        for keyword in sorted(keywords)[:50]:  # Limit to top 50
-            md.append(f"- {keyword}")
+        # Limit to top 50 (partial sort: no need to order the rest)
+        write("".join(f"- {keyword}\n" for keyword in heapq.nsmallest(50, keywords)))
     else:
-        md.append("- No entries yet")
+        write("- No entries yet\n")
 
-    md.append("")
-    md.append("---")
-    md.append("")
+    write(_SECTION_BREAK)
 
     # Deprecated entries
-    deprecated_entries = [e for e in entries if e.get("deprecated", False)]
-    md.append("## ⚠️ Deprecated Entries")
-    md.append("")
-    md.append(f"**Count**: {len(deprecated_entries)}")
-    md.append("")
-    md.append("| unique_id | Type | Deprecated Date | Superseded By | Reason |")
-    md.append("|-----------|------|-----------------|---------------|--------|")
+    write(_DEPRECATED_HEADER)
+    write(f"**Count**: {deprecated_count}\n")
+    write(_DEPRECATED_TABLE_HEADER)
     if deprecated_entries:
-        for entry in deprecated_entries[:10]:  # Limit to 10 most recent
-            unique_id = entry.get("unique_id", "-")
-            entry_type = entry.get("type", "-")
-            deprecated_date = entry.get("deprecated_date", "-")
-            superseded_by = entry.get("superseded_by", "-")
-            reason = entry.get("deprecation_reason", "-")[:50]
-            md.append(
-                f"| {unique_id} | {entry_type} | {deprecated_date} | {superseded_by} | {reason} |"
-            )
-    else:
-        md.append("| - | - | - | - | - |")
-
-    md.append("")
-    md.append("---")
-    md.append("")
-    md.append("**Auto-Update Script**: `validation/update_inventory.py`")
-    md.append("**Next Scheduled Update**: After next knowledge entry")
-    md.append("")
-
-    return "\n".join(md)
-
-
-def _generate_arch_decisions_table(entries: List[Dict]) -> List[str]:
-    """Generate architecture decisions section."""
-    filtered = [e for e in entries if e.get("type") == "architecture_decision"]
-    md = [
-        "### Architecture Decisions",
-        "",
-        f"**Count**: {len(filtered)}",
-        "",
-        "| unique_id | Component | Breaking | Importance | Created | Status |",
-        "|-----------|-----------|----------|------------|---------|--------|",
-    ]
-
-    if filtered:
-        for entry in filtered[:20]:  # Limit to 20 most recent
-            unique_id = entry.get("unique_id", "-")
-            component = entry.get("component", "-")
-            breaking = "Yes" if entry.get("breaking_change", False) else "No"
-            importance = entry.get("importance", "-")
-            created = entry.get("created_at", "-")
-            status = "Deprecated" if entry.get("deprecated", False) else "Active"
-            md.append(
-                f"| {unique_id} | {component} | {breaking} | {importance} | {created} | {status} |"
-            )
+        _write_rows(
+            buf,
+            _DEPRECATED_ROW,
+            deprecated_entries[:10],  # Limit to 10 most recent
+            _deprecated_entry_fields,
+        )
     else:
-        md.append("| - | - | - | - | - | - |")
+        write("| - | - | - | - | - |\n")
 
-    md.extend(["", "---", ""])
-    return md
+    write(_FOOTER)
 
+    return buf.getvalue()
 
-def _generate_agent_specs_table(entries: List[Dict]) -> List[str]:
-    """Generate agent specifications section."""
-    filtered = [e for e in entries if e.get("type") == "agent_spec"]
-    md = [
-        "### Agent Specifications",
-        "",
-        f"**Count**: {len(filtered)}",
-        "",
-        "| unique_id | Agent ID | Agent Name | Importance | Created | Status |",
-        "|-----------|----------|------------|------------|---------|--------|",
-    ]
-
-    if filtered:
-        for entry in filtered[:20]:
-            unique_id = entry.get("unique_id", "-")
-            agent_id = entry.get("agent_id", "-")
-            agent_name = entry.get("agent_name", "-")
-            importance = entry.get("importance", "-")
-            created = entry.get("created_at", "-")
-            status = "Deprecated" if entry.get("deprecated", False) else "Active"
-            md.append(
-                f"| {unique_id} | {agent_id} | {agent_name} | {importance} | {created} | {status} |"
-            )
-    else:
-        md.append("| - | - | - | - | - | - |")
-
-    md.extend(["", "---", ""])
-    return md
 
+def _write_rows(
+    buf: io.StringIO,
+    row_format: str,
+    entries: List[Dict],
+    derive: Callable[[Dict], Dict],
+) -> None:
+    """
+    Write one table row per entry to the output buffer.
 
-def _generate_story_outcomes_table(entries: List[Dict]) -> List[str]:
-    """Generate story outcomes section."""
-    filtered = [e for e in entries if e.get("type") == "story_outcome"]
-    md = [
-        "### Story Outcomes",
-        "",
-        f"**Count**: {len(filtered)}",
-        "",
-        "| unique_id | Story ID | Epic | Importance | Created | Status |",
-        "|-----------|----------|------|------------|---------|--------|",
-    ]
+    Args:
+        buf: Output buffer
+        row_format: Row template naming entry fields and derived fields
+        entries: Entries to render, one row each
+        derive: Returns the computed fields for an entry (e.g. status)
+    """
+    buf.write(
+        "".join(
+            row_format.format_map(_Row(entry, **derive(entry))) + "\n"
+            for entry in entries
+        )
+    )
 
-    if filtered:
-        for entry in filtered[:20]:
-            unique_id = entry.get("unique_id", "-")
-            story_id = entry.get("story_id", "-")
-            epic = entry.get("epic_id", "-")
-            importance = entry.get("importance", "-")
-            created = entry.get("created_at", "-")
-            status = "Deprecated" if entry.get("deprecated", False) else "Active"
-            md.append(
-                f"| {unique_id} | {story_id} | {epic} | {importance} | {created} | {status} |"
-            )
-    else:
-        md.append("| - | - | - | - | - | - |")
 
-    md.extend(["", "---", ""])
-    return md
+def _deprecation_status(entry: Dict) -> Dict:
+    """Derived fields for tables with a Deprecated/Active status column."""
+    return {"status": "Deprecated" if entry.get("deprecated", False) else "Active"}
 
 
-def _generate_error_patterns_table(entries: List[Dict]) -> List[str]:
-    """Generate error patterns section."""
-    filtered = [e for e in entries if e.get("type") == "error_pattern"]
-    md = [
-        "### Error Patterns",
-        "",
-        f"**Count**: {len(filtered)}",
-        "",
-        "| unique_id | Component | Severity | Created | Status |",
-        "|-----------|-----------|----------|---------|--------|",
-    ]
+def _arch_decision_fields(entry: Dict) -> Dict:
+    """Derived fields for the architecture decisions table."""
+    return {
+        "breaking": "Yes" if entry.get("breaking_change", False) else "No",
+        "status": "Deprecated" if entry.get("deprecated", False) else "Active",
+    }
 
-    if filtered:
-        for entry in filtered[:20]:
-            unique_id = entry.get("unique_id", "-")
-            component = entry.get("component", "-")
-            severity = entry.get("severity", "-")
-            created = entry.get("created_at", "-")
-            status = "Resolved" if entry.get("resolved", False) else "Active"
-            md.append(
-                f"| {unique_id} | {component} | {severity} | {created} | {status} |"
-            )
-    else:
-        md.append("| - | - | - | - | - |")
 
-    md.extend(["", "---", ""])
-    return md
+def _error_pattern_status(entry: Dict) -> Dict:
+    """Derived fields for the error patterns table (Resolved/Active status)."""
+    return {"status": "Resolved" if entry.get("resolved", False) else "Active"}
 
 
-def _generate_database_schemas_table(entries: List[Dict]) -> List[str]:
-    """Generate database schemas section."""
-    filtered = [e for e in entries if e.get("type") == "database_schema"]
-    md = [
-        "### Database Schemas",
-        "",
-        f"**Count**: {len(filtered)}",
-        "",
-        "| unique_id | Table | Database | Created | Status |",
-        "|-----------|-------|----------|---------|--------|",
-    ]
+def _deprecated_entry_fields(entry: Dict) -> Dict:
+    """Derived fields for the deprecated entries table."""
+    return {"reason": entry.get("deprecation_reason", "-")[:50]}
 
-    if filtered:
-        for entry in filtered[:20]:
-            unique_id = entry.get("unique_id", "-")
-            table = entry.get("table_name", "-")
-            database = entry.get("database", "-")
-            created = entry.get("created_at", "-")
-            status = "Deprecated" if entry.get("deprecated", False) else "Active"
-            md.append(f"| {unique_id} | {table} | {database} | {created} | {status} |")
-    else:
-        md.append("| - | - | - | - | - |")
 
-    md.extend(["", "---", ""])
-    return md
+class TableSpec(NamedTuple):
+    """Layout of one detailed inventory table."""
 
+    title: str
+    header: str  # Column header and separator lines
+    empty_row: str  # Placeholder row written when the type has no entries
+    row_format: str
+    derive: Callable[[Dict], Dict]
 
-def _generate_config_patterns_table(entries: List[Dict]) -> List[str]:
-    """Generate config patterns section."""
-    filtered = [e for e in entries if e.get("type") == "config_pattern"]
-    md = [
-        "### Config Patterns",
-        "",
-        f"**Count**: {len(filtered)}",
-        "",
-        "| unique_id | Component | Importance | Created | Status |",
-        "|-----------|-----------|------------|---------|--------|",
-    ]
 
-    if filtered:
-        for entry in filtered[:20]:
-            unique_id = entry.get("unique_id", "-")
-            component = entry.get("component", "-")
-            importance = entry.get("importance", "-")
-            created = entry.get("created_at", "-")
-            status = "Deprecated" if entry.get("deprecated", False) else "Active"
-            md.append(
-                f"| {unique_id} | {component} | {importance} | {created} | {status} |"
-            )
-    else:
-        md.append("| - | - | - | - | - |")
+def _table_spec(
+    title: str,
+    columns: List[str],
+    row_format: str,
+    derive: Callable[[Dict], Dict],
+) -> TableSpec:
+    """Build a TableSpec, deriving the header lines from the column names."""
+    return TableSpec(
+        title=title,
+        header=(
+            "| " + " | ".join(columns) + " |\n"
+            "|" + "|".join("-" * (len(column) + 2) for column in columns) + "|\n"
+        ),
+        empty_row="|" + " - |" * len(columns) + "\n",
+        row_format=row_format,
+        derive=derive,
+    )
 
-    md.extend(["", "---", ""])
-    return md
 
+# Detailed inventory tables by knowledge type, in output order
+TABLE_SPECS: Dict[str, TableSpec] = {
+    "architecture_decision": _table_spec(
+        "Architecture Decisions",
+        ["unique_id", "Component", "Breaking", "Importance", "Created", "Status"],
+        _ARCH_DECISION_ROW,
+        _arch_decision_fields,
+    ),
+    "agent_spec": _table_spec(
+        "Agent Specifications",
+        ["unique_id", "Agent ID", "Agent Name", "Importance", "Created", "Status"],
+        _AGENT_SPEC_ROW,
+        _deprecation_status,
+    ),
+    "story_outcome": _table_spec(
+        "Story Outcomes",
+        ["unique_id", "Story ID", "Epic", "Importance", "Created", "Status"],
+        _STORY_OUTCOME_ROW,
+        _deprecation_status,
+    ),
+    "error_pattern": _table_spec(
+        "Error Patterns",
+        ["unique_id", "Component", "Severity", "Created", "Status"],
+        _ERROR_PATTERN_ROW,
+        _error_pattern_status,
+    ),
+    "database_schema": _table_spec(
+        "Database Schemas",
+        ["unique_id", "Table", "Database", "Created", "Status"],
+        _DATABASE_SCHEMA_ROW,
+        _deprecation_status,
+    ),
+    "config_pattern": _table_spec(
+        "Config Patterns",
+        ["unique_id", "Component", "Importance", "Created", "Status"],
+        _COMPONENT_ROW,
+        _deprecation_status,
+    ),
+    "integration_example": _table_spec(
+        "Integration Examples",
+        ["unique_id", "Component", "Importance", "Created", "Status"],
+        _COMPONENT_ROW,
+        _deprecation_status,
+    ),
+}
+
+
+def _generate_table(buf: io.StringIO, spec: TableSpec, filtered: List[Dict]) -> None:
+    """
+    Write one detailed inventory section to the output buffer.
 
-def _generate_integration_examples_table(entries: List[Dict]) -> List[str]:
-    """Generate integration examples section."""
-    filtered = [e for e in entries if e.get("type") == "integration_example"]
-    md = [
-        "### Integration Examples",
-        "",
-        f"**Count**: {len(filtered)}",
-        "",
-        "| unique_id | Component | Importance | Created | Status |",
-        "|-----------|-----------|------------|---------|--------|",
-    ]
+    Args:
+        buf: Output buffer
+        spec: Title, header and row layout of the section
+        filtered: Entries of the section's knowledge type
+    """
+    buf.write(f"### {spec.title}\n\n**Count**: {len(filtered)}\n\n{spec.header}")
 
     if filtered:
-        for entry in filtered[:20]:
-            unique_id = entry.get("unique_id", "-")
-            component = entry.get("component", "-")
-            importance = entry.get("importance", "-")
-            created = entry.get("created_at", "-")
-            status = "Deprecated" if entry.get("deprecated", False) else "Active"
-            md.append(
-                f"| {unique_id} | {component} | {importance} | {created} | {status} |"
-            )
+        # Limit to 20 most recent
+        _write_rows(buf, spec.row_format, filtered[:20], spec.derive)
     else:
-        md.append("| - | - | - | - | - |")
+        buf.write(spec.empty_row)
 
-    md.extend(["", "---", ""])
-    return md
+    buf.write(_SECTION_BREAK)
 
 
 def update_inventory(entries: List[Dict], output_path: str = None) -> str:
@@ -414,6 +381,7 @@ def update_inventory(entries: List[Dict], output_path: str = None) -> str:
     Raises:
         ValueError: If output_path is outside allowed directory (prevents path traversal)
     """
+    _intern_entry_fields(entries)
     markdown = generate_inventory_markdown(entries)
 
     if output_path:
@@ -429,7 +397,9 @@ def update_inventory(entries: List[Dict], output_path: str = None) -> str:
             )
 
         path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(markdown)
+        # Encode explicitly: the inventory contains emoji, and write_text()
+        # would use the platform default encoding
+        path.write_bytes(markdown.encode("utf-8"))
         print(f"✓ Inventory updated: {output_path}")
 
     return markdown
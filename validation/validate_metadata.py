@@ -8,14 +8,35 @@ Ensures all required fields are present and meet constraints.
 Usage:
     python validate_metadata.py --metadata metadata.json --type architecture_decision
     python validate_metadata.py --metadata metadata.json --auto-detect
+    python validate_metadata.py --batch "entries/**/*.json"
 """
 
+import hashlib
 import json
+import math
+import re
 import sys
-import argparse
+import glob
+from collections import OrderedDict
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Dict, Any, Tuple
-from jsonschema import validate, ValidationError
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+from jsonschema.exceptions import SchemaError, best_match
+from jsonschema.validators import validator_for
+
+# Optional: orjson parses much faster than the json module. _json_loads only
+# keeps its result where it matches json.loads, so no verdict depends on it.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional: fastjsonschema compiles each schema into a plain Python function,
+# which is much faster than jsonschema for metadata that passes
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
 
 
 # Path to schema directory
@@ -24,6 +45,22 @@ SCHEMA_DIR = Path(__file__).parent.parent / "metadata-schemas"
 # Security: Limits to prevent ReDoS and memory exhaustion attacks
 MAX_JSON_DEPTH = 100  # Prevent deeply nested JSON attacks
 MAX_JSON_SIZE = 1_000_000  # 1MB limit for metadata
+# Metadata files may be pretty-printed, so allow room for whitespace
+MAX_METADATA_FILE_SIZE = 2 * MAX_JSON_SIZE
+
+# Batch validation: smaller batches run in-process, larger ones are sent to
+# worker processes in chunks of BATCH_CHUNK_SIZE files
+BATCH_PARALLEL_MIN_FILES = 32
+BATCH_CHUNK_SIZE = 16
+# Scalars whose serialized form is at most 24 bytes, plus the 64-bit int range
+# (at most 20 digits and a sign)
+_SHORT_SCALAR_TYPES = frozenset((bool, float, type(None)))
+_INT_MIN = -(2**63)
+_INT_MAX = 2**64 - 1
+_TOO_DEEP_MESSAGE = (
+    f"Security: JSON too deeply nested (max: {MAX_JSON_DEPTH} levels). "
+    f"This prevents ReDoS attacks."
+)
 
 # Allowed knowledge types
 ALLOWED_TYPES = [
@@ -36,37 +73,275 @@ ALLOWED_TYPES = [
     "integration_example",
     "best_practice",  # Agent-discovered best practices
 ]
+_ALLOWED_TYPE_SET = frozenset(ALLOWED_TYPES)
+_ALLOWED_TYPES_TEXT = ", ".join(ALLOWED_TYPES)
+
+# Most recent run_all_validations results, least recently used first, keyed
+# on the type override and the SHA256 digest of the metadata's canonical JSON
+VALIDATION_CACHE_SIZE = 1024
+_validation_cache: "OrderedDict[Tuple[Optional[str], bytes], Tuple[bool, tuple]]" = (
+    OrderedDict()
+)
+
+# Fields every knowledge type requires, checked before schema validation
+REQUIRED_FIELDS = ("unique_id", "type", "component", "importance", "created_at")
+_REQUIRED_FIELD_SET = frozenset(REQUIRED_FIELDS)
+_REQUIRED_FIELDS_TEXT = ", ".join(REQUIRED_FIELDS)
+
+# Success messages shared by the single checks and _quick_checks
+_REQUIRED_FIELDS_OK = "✓ All critical required fields present"
+_IMPORTANCE_OK = "✓ Importance level '{}' is valid"
+_UNIQUE_ID_OK = "✓ unique_id format matches type '{}'"
+
+# Allowed importance levels, highest first
+IMPORTANCE_LEVELS = ("critical", "high", "medium", "low")
+_IMPORTANCE_LEVEL_SET = frozenset(IMPORTANCE_LEVELS)
+_IMPORTANCE_LEVELS_TEXT = ", ".join(IMPORTANCE_LEVELS)
+
+# Expected unique_id prefix for each knowledge type
+UNIQUE_ID_PREFIXES = {
+    "architecture_decision": "arch-decision-",
+    "agent_spec": "agent-",
+    "story_outcome": "story-",
+    "error_pattern": "error-",
+    "database_schema": "schema-",
+    "config_pattern": "config-",
+    "integration_example": "integration-",
+    "best_practice": "bp-",  # Format: bp-{technology}-{topic}-{YYYY-MM-DD}
+}
+
+# Runs of 19+ digits may be integers outside the 64-bit range, which orjson
+# reads as floats where json.loads keeps the exact int
+_LONG_DIGITS_PATTERN = re.compile(r"[0-9]{19}")
+_LONG_DIGITS_BYTES_PATTERN = re.compile(rb"[0-9]{19}")
+
+# JSON string literals (with escapes) and the brackets left once they are removed
+_JSON_STRING_PATTERN = re.compile(r'"(?:[^"\\]|\\.)*"')
+_JSON_BRACKET_PATTERN = re.compile(r"[\[\]{}]")
+
+
+def _json_loads(data: Any) -> Any:
+    """
+    Parse JSON text or UTF-8 bytes, giving exactly what json.loads gives.
+
+    orjson is used when installed, except for text with very long digit runs
+    (big integers) and text orjson rejects but json.loads accepts (NaN,
+    Infinity, lone surrogates, UTF-16 input). Those are parsed by json.loads,
+    which also raises the JSONDecodeError for invalid input.
 
+    Args:
+        data: JSON as str or bytes
+
+    Returns:
+        Parsed JSON value
 
-def validate_json_safety(obj: Any, depth: int = 0) -> None:
+    Raises:
+        json.JSONDecodeError: If data is not valid JSON
+    """
+    if orjson is not None:
+        if isinstance(data, str):
+            long_digits = _LONG_DIGITS_PATTERN.search(data)
+        else:
+            long_digits = _LONG_DIGITS_BYTES_PATTERN.search(data)
+        if long_digits is None:
+            try:
+                return orjson.loads(data)
+            except orjson.JSONDecodeError:
+                pass
+    return json.loads(data)
+
+
+def validate_json_safety(
+    obj: Any, depth: int = 0, max_size: Optional[int] = None
+) -> int:
     """
     Validate JSON structure is safe (not too deep, preventing ReDoS).
 
+    Walks the structure with an explicit stack rather than recursing, so no
+    Python frame is set up per level and a larger MAX_JSON_DEPTH can never
+    run into the interpreter's recursion limit.
+
+    The same walk adds up a lower bound on the compact serialized size (every
+    string character is at least one UTF-8 byte, plus quotes, separators and
+    brackets), so payloads that are certainly over max_size are rejected
+    without serializing them.
+
     Args:
         obj: JSON object to validate
-        depth: Current recursion depth
+        depth: Depth of obj itself
+        max_size: Optional serialized size limit in bytes
+
+    Returns:
+        Lower bound on the serialized size of obj in bytes
 
     Raises:
-        ValueError: If JSON is too deeply nested or structure is unsafe
+        ValueError: If JSON is too deeply nested, certainly exceeds max_size,
+            or structure is unsafe
+    """
+    return _json_size_bounds(obj, depth, max_size)[0]
+
+
+def _json_size_bounds(
+    obj: Any, depth: int, max_size: Optional[int]
+) -> Tuple[int, Optional[int], bool]:
+    """
+    Walk for validate_json_safety, also bounding the serialized size above.
+
+    The walk also reports whether obj is plain JSON data: dicts with string
+    keys, lists, strings, ints, finite floats, bools and None, with no
+    subclasses. Other values (tuples, dates, NaN) may serialize or validate
+    like a plain value they are not equal to.
+
+    The upper bound holds for plain JSON data when every string and key is
+    ASCII (at most six bytes per character, for \\u00XX escapes) and every int
+    is 64-bit (at most 24 bytes per scalar). Otherwise it is unknown.
+
+    Returns:
+        Tuple of (lower bound, upper bound or None if unknown, plain JSON)
+
+    Raises:
+        ValueError: If JSON is too deeply nested or certainly exceeds max_size
     """
     if depth > MAX_JSON_DEPTH:
-        raise ValueError(
-            f"Security: JSON too deeply nested (max: {MAX_JSON_DEPTH} levels). "
-            f"This prevents ReDoS attacks."
-        )
+        raise ValueError(_TOO_DEEP_MESSAGE)
+
+    # Only containers go on the stack; scalars are sized where they are found
+    scalars = 0
+    if isinstance(obj, (dict, list)):
+        min_size = 0
+        plain = type(obj) is dict or type(obj) is list
+        stack = [(obj, depth)]
+    else:
+        min_size = len(obj) + 2 if isinstance(obj, str) else 1
+        plain = False
+        stack = []
+    # Only plain JSON data has a known upper bound
+    bounded = plain
+
+    while True:
+        if max_size is not None and min_size > max_size:
+            raise ValueError(
+                f"Metadata too large (over {max_size:,} bytes).\n"
+                f"Maximum allowed: {max_size:,} bytes.\n"
+                f"This prevents memory exhaustion attacks."
+            )
+        if not stack:
+            break
+
+        current, current_depth = stack.pop()
+        if isinstance(current, dict):
+            try:
+                keys = "".join(current)
+            except TypeError:
+                # Non-string keys serialize via their repr, which is unbounded
+                keys = "".join(key for key in current if isinstance(key, str))
+                plain = bounded = False
+            # Braces and commas, plus quotes and a colon around every key
+            min_size += 1 + 4 * len(current) + len(keys)
+            if bounded and not keys.isascii():
+                bounded = False
+            children = current.values()
+        else:
+            min_size += 1 + len(current)
+            children = current
+
+        child_depth = current_depth + 1
+        if child_depth > MAX_JSON_DEPTH and current:
+            raise ValueError(_TOO_DEEP_MESSAGE)
+        for child in children:
+            # Exact type checks first: plain JSON values skip isinstance's
+            # subclass handling; subclasses still take the isinstance path
+            child_type = type(child)
+            if child_type is str:
+                min_size += len(child) + 2
+                if bounded and not child.isascii():
+                    bounded = False
+            elif child_type is dict or child_type is list:
+                stack.append((child, child_depth))
+            elif child_type in _SHORT_SCALAR_TYPES or (
+                child_type is int and _INT_MIN <= child <= _INT_MAX
+            ):
+                min_size += 1
+                scalars += 1
+                # NaN and infinity are not JSON; orjson writes them as null
+                if child_type is float and not math.isfinite(child):
+                    plain = bounded = False
+            elif child_type is int:
+                min_size += 1
+                bounded = False
+            elif isinstance(child, (dict, list)):
+                stack.append((child, child_depth))
+                plain = bounded = False
+            elif isinstance(child, str):
+                min_size += len(child) + 2
+                plain = bounded = False
+            else:
+                min_size += 1
+                plain = bounded = False
+
+    # Every lower-bound byte stands for at most six output bytes, and each
+    # counted scalar serializes to at most 24
+    return min_size, 6 * min_size + 24 * scalars if bounded else None, plain
+
+
+def serialized_size(metadata: Any) -> int:
+    """
+    Return the size in bytes of metadata serialized as compact UTF-8 JSON.
+
+    Always uses the stdlib json module: orjson formats floats differently
+    (1e16 rather than 1e+16), writes NaN as null and serializes UUIDs and
+    dataclasses json rejects, so its byte count would make the size limit
+    depend on whether it is installed.
 
-    if isinstance(obj, dict):
-        for key, value in obj.items():
-            validate_json_safety(value, depth + 1)
-    elif isinstance(obj, list):
-        for item in obj:
-            validate_json_safety(item, depth + 1)
+    Args:
+        metadata: JSON-compatible object
+
+    Returns:
+        Serialized size in bytes
+
+    Raises:
+        TypeError: If metadata is not JSON serializable
+        ValueError: If metadata contains circular references
+    """
+    return len(
+        json.dumps(metadata, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    )
 
 
+def json_text_depth(text: str) -> int:
+    """
+    Measure the bracket nesting depth of raw JSON text without parsing it.
+
+    String literals are stripped first so brackets inside values are ignored.
+    A container at bracket depth N sits at depth N - 1 in validate_json_safety,
+    so the result is an upper bound of one more than that check reports.
+
+    Args:
+        text: Raw JSON text
+
+    Returns:
+        Maximum number of simultaneously open '{' / '[' brackets
+    """
+    depth = 0
+    max_depth = 0
+    for bracket in _JSON_BRACKET_PATTERN.findall(_JSON_STRING_PATTERN.sub("", text)):
+        if bracket in "{[":
+            depth += 1
+            if depth > max_depth:
+                max_depth = depth
+        else:
+            depth -= 1
+    return max_depth
+
+
+@lru_cache(maxsize=None)
 def load_schema(knowledge_type: str) -> Dict[str, Any]:
     """
     Load JSON schema for specified knowledge type.
 
+    Each schema file is read once per process; the returned dict is shared
+    between callers and must not be modified.
+
     Args:
         knowledge_type: Type of knowledge (e.g., 'architecture_decision')
 
@@ -79,14 +354,68 @@ def load_schema(knowledge_type: str) -> Dict[str, Any]:
     """
     schema_file = SCHEMA_DIR / f"{knowledge_type}.json"
 
-    if not schema_file.exists():
+    # Open directly rather than stat first: one syscall, and no window for
+    # the file to disappear between the check and the open
+    try:
+        f = open(schema_file, "rb")
+    except FileNotFoundError:
         raise FileNotFoundError(
             f"Schema file not found: {schema_file}\n"
-            f"Available types: {', '.join(ALLOWED_TYPES)}"
-        )
+            f"Available types: {_ALLOWED_TYPES_TEXT}"
+        ) from None
+
+    with f:
+        return _json_loads(f.read())
 
-    with open(schema_file, "r") as f:
-        return json.load(f)
+
+@lru_cache(maxsize=None)
+def get_validator(knowledge_type: str) -> Any:
+    """
+    Get the compiled jsonschema validator for a knowledge type.
+
+    The schema is loaded, checked against its metaschema and compiled into a
+    validator once per process; later calls reuse it.
+
+    Args:
+        knowledge_type: Type of knowledge (e.g., 'architecture_decision')
+
+    Returns:
+        jsonschema validator instance for the type's schema
+
+    Raises:
+        FileNotFoundError: If schema file doesn't exist
+        json.JSONDecodeError: If schema file is invalid JSON
+        jsonschema.SchemaError: If the schema itself is invalid
+    """
+    schema = load_schema(knowledge_type)
+    validator_class = validator_for(schema)
+    validator_class.check_schema(schema)
+    return validator_class(schema)
+
+
+@lru_cache(maxsize=None)
+def get_fast_validator(knowledge_type: str) -> Optional[Callable[[Any], Any]]:
+    """
+    Get the fastjsonschema validation function for a knowledge type.
+
+    Formats are not checked and defaults are not filled in, matching the
+    jsonschema validator. Compiled once per process.
+
+    Args:
+        knowledge_type: Type of knowledge (e.g., 'architecture_decision')
+
+    Returns:
+        Validation function raising on invalid metadata, or None if
+        fastjsonschema is not installed or cannot compile the schema
+    """
+    if fastjsonschema is None:
+        return None
+    try:
+        return fastjsonschema.compile(
+            load_schema(knowledge_type), use_formats=False, use_default=False
+        )
+    except fastjsonschema.JsonSchemaDefinitionException:
+        return None
 
 
 def validate_metadata(
@@ -102,24 +431,17 @@ def validate_metadata(
     Returns:
         Tuple of (is_valid: bool, message: str)
     """
-    # Security: Check JSON size (prevent memory exhaustion)
-    try:
-        json_str = json.dumps(metadata)
-        if len(json_str) > MAX_JSON_SIZE:
-            return False, (
-                f"ERROR: Metadata too large ({len(json_str):,} bytes).\n"
-                f"Maximum allowed: {MAX_JSON_SIZE:,} bytes (1MB).\n"
-                f"This prevents memory exhaustion attacks."
-            )
-    except (TypeError, ValueError) as e:
-        return False, f"ERROR: Metadata is not JSON serializable: {e}"
+    return _validate_metadata(metadata, knowledge_type, None)
 
-    # Security: Check JSON depth (prevent ReDoS)
-    try:
-        validate_json_safety(metadata)
-    except ValueError as e:
-        return False, f"ERROR: {e}"
 
+def _validate_metadata(
+    metadata: Dict[str, Any],
+    knowledge_type: Optional[str],
+    size_bounds: Optional[Tuple[int, Optional[int], bool]],
+) -> Tuple[bool, str]:
+    """validate_metadata, reusing _json_size_bounds output if already computed."""
+    # Type checks are cheap and reject most invalid input, so they run before
+    # the security checks serialize and walk the whole structure.
     # Auto-detect type if not provided
     if knowledge_type is None:
         if "type" not in metadata:
@@ -127,33 +449,110 @@ def validate_metadata(
         knowledge_type = metadata["type"]
 
     # Validate type is allowed
-    if knowledge_type not in ALLOWED_TYPES:
+    # Non-string values are unhashable or invalid either way
+    if not isinstance(knowledge_type, str) or knowledge_type not in _ALLOWED_TYPE_SET:
         return False, (
             f"ERROR: Invalid type '{knowledge_type}'\n"
-            f"Allowed types: {', '.join(ALLOWED_TYPES)}"
+            f"Allowed types: {_ALLOWED_TYPES_TEXT}"
         )
 
-    # Load schema
+    # Security: Check JSON depth (prevent ReDoS); the same walk rejects
+    # payloads that are certainly too large before anything is serialized
+    if size_bounds is None:
+        try:
+            size_bounds = _json_size_bounds(metadata, 0, MAX_JSON_SIZE)
+        except ValueError as e:
+            return False, f"ERROR: {e}"
+    _min_size, max_bound, plain = size_bounds
+
+    # Security: Check exact JSON size (prevent memory exhaustion), unless the
+    # walk's upper bound already shows plain JSON data well within the limit
+    if max_bound is None or max_bound > MAX_JSON_SIZE:
+        try:
+            size = serialized_size(metadata)
+            if size > MAX_JSON_SIZE:
+                return False, (
+                    f"ERROR: Metadata too large ({size:,} bytes).\n"
+                    f"Maximum allowed: {MAX_JSON_SIZE:,} bytes (1MB).\n"
+                    f"This prevents memory exhaustion attacks."
+                )
+        except (TypeError, ValueError) as e:
+            return False, f"ERROR: Metadata is not JSON serializable: {e}"
+
+    # Load compiled validator
     try:
-        schema = load_schema(knowledge_type)
+        validator = get_validator(knowledge_type)
     except FileNotFoundError as e:
         return False, str(e)
     except json.JSONDecodeError as e:
         return False, f"ERROR: Schema file is invalid JSON: {e}"
-
-    # Validate against schema
-    try:
-        validate(instance=metadata, schema=schema)
+    except SchemaError as e:
+        return False, f"ERROR: Invalid schema for '{knowledge_type}': {e.message}"
+
+    # Fast path for valid metadata; failures are re-checked by jsonschema,
+    # which stays the reference and reports the error. Only plain JSON data
+    # takes it: fastjsonschema accepts tuples as arrays, jsonschema does not.
+    fast_validate = get_fast_validator(knowledge_type) if plain else None
+    if fast_validate is not None:
+        try:
+            fast_validate(metadata)
+            return True, f"✓ Metadata valid for type '{knowledge_type}'"
+        except fastjsonschema.JsonSchemaValueException:
+            pass
+
+    # Validate against schema (best_match reports the same error as validate())
+    error = best_match(validator.iter_errors(metadata))
+    if error is None:
         return True, f"✓ Metadata valid for type '{knowledge_type}'"
-    except ValidationError as e:
-        error_path = " → ".join([str(p) for p in e.path]) if e.path else "root"
+
+    error_path = " → ".join(map(str, error.path)) if error.path else "root"
+    return False, (
+        f"ERROR: Metadata validation failed\n"
+        f"Path: {error_path}\n"
+        f"Message: {error.message}\n"
+        f"Schema rule: {error.schema.get('description', 'No description')}"
+    )
+
+
+def validate_metadata_json(text: str, knowledge_type: str = None) -> Tuple[bool, str]:
+    """
+    Validate metadata supplied as raw JSON text.
+
+    Oversized or obviously over-nested input is rejected before it is parsed,
+    so no Python object graph is built for it.
+
+    Args:
+        text: Metadata as a JSON string
+        knowledge_type: Optional type override (auto-detected from metadata['type'] if not provided)
+
+    Returns:
+        Tuple of (is_valid: bool, message: str)
+    """
+    # Security: Check JSON size (prevent memory exhaustion)
+    if len(text) > MAX_JSON_SIZE:
         return False, (
-            f"ERROR: Metadata validation failed\n"
-            f"Path: {error_path}\n"
-            f"Message: {e.message}\n"
-            f"Schema rule: {e.schema.get('description', 'No description')}"
+            f"ERROR: Metadata too large ({len(text):,} bytes).\n"
+            f"Maximum allowed: {MAX_JSON_SIZE:,} bytes (1MB).\n"
+            f"This prevents memory exhaustion attacks."
         )
 
+    # Security: Check JSON depth (prevent ReDoS) - exact check runs after parsing
+    if json_text_depth(text) > MAX_JSON_DEPTH + 1:
+        return False, (
+            f"ERROR: Security: JSON too deeply nested (max: {MAX_JSON_DEPTH} levels). "
+            f"This prevents ReDoS attacks."
+        )
+
+    try:
+        metadata = _json_loads(text)
+    except json.JSONDecodeError as e:
+        return False, f"ERROR: Invalid JSON: {e}"
+
+    if not isinstance(metadata, dict):
+        return False, "ERROR: Metadata must be a JSON object"
+
+    return validate_metadata(metadata, knowledge_type)
+
 
 def validate_required_fields(metadata: Dict[str, Any]) -> Tuple[bool, str]:
     """
@@ -167,16 +566,16 @@ def validate_required_fields(metadata: Dict[str, Any]) -> Tuple[bool, str]:
     Returns:
         Tuple of (is_valid: bool, message: str)
     """
-    required_fields = ["unique_id", "type", "component", "importance", "created_at"]
-    missing_fields = [field for field in required_fields if field not in metadata]
-
-    if missing_fields:
+    # One C-level subset test in the common case; list what is missing only
+    # when something is
+    if not metadata.keys() >= _REQUIRED_FIELD_SET:
+        missing_fields = [field for field in REQUIRED_FIELDS if field not in metadata]
         return False, (
             f"ERROR: Missing required fields: {', '.join(missing_fields)}\n"
-            f"Required fields: {', '.join(required_fields)}"
+            f"Required fields: {_REQUIRED_FIELDS_TEXT}"
         )
 
-    return True, "✓ All critical required fields present"
+    return True, _REQUIRED_FIELDS_OK
 
 
 def validate_importance_level(metadata: Dict[str, Any]) -> Tuple[bool, str]:
@@ -189,16 +588,22 @@ def validate_importance_level(metadata: Dict[str, Any]) -> Tuple[bool, str]:
     Returns:
         Tuple of (is_valid: bool, message: str)
     """
-    allowed_importance = ["critical", "high", "medium", "low"]
     importance = metadata.get("importance")
 
-    if importance not in allowed_importance:
+    if not isinstance(importance, str) or importance not in _IMPORTANCE_LEVEL_SET:
         return False, (
             f"ERROR: Invalid importance level '{importance}'\n"
-            f"Allowed values: {', '.join(allowed_importance)}"
+            f"Allowed values: {_IMPORTANCE_LEVELS_TEXT}"
         )
 
-    return True, f"✓ Importance level '{importance}' is valid"
+    return True, _IMPORTANCE_OK.format(importance)
+
+
+def _expected_unique_id_prefix(knowledge_type: Any) -> Optional[str]:
+    """Expected unique_id prefix for a type; None for unknown or non-string types."""
+    if not isinstance(knowledge_type, str):
+        return None
+    return UNIQUE_ID_PREFIXES.get(knowledge_type)
 
 
 def validate_unique_id_format(metadata: Dict[str, Any]) -> Tuple[bool, str]:
@@ -214,27 +619,78 @@ def validate_unique_id_format(metadata: Dict[str, Any]) -> Tuple[bool, str]:
     unique_id = metadata.get("unique_id", "")
     knowledge_type = metadata.get("type", "")
 
-    # Expected prefixes for each type
-    expected_prefixes = {
-        "architecture_decision": "arch-decision-",
-        "agent_spec": "agent-",
-        "story_outcome": "story-",
-        "error_pattern": "error-",
-        "database_schema": "schema-",
-        "config_pattern": "config-",
-        "integration_example": "integration-",
-        "best_practice": "bp-",  # Format: bp-{technology}-{topic}-{YYYY-MM-DD}
-    }
-
-    expected_prefix = expected_prefixes.get(knowledge_type)
-    if expected_prefix and not unique_id.startswith(expected_prefix):
+    expected_prefix = _expected_unique_id_prefix(knowledge_type)
+    if expected_prefix and not (
+        isinstance(unique_id, str) and unique_id.startswith(expected_prefix)
+    ):
         return False, (
             f"WARNING: unique_id '{unique_id}' doesn't follow expected format\n"
             f"Expected prefix: '{expected_prefix}'\n"
             f"Example: {expected_prefix}example-name"
         )
 
-    return True, f"✓ unique_id format matches type '{knowledge_type}'"
+    return True, _UNIQUE_ID_OK.format(knowledge_type)
+
+
+def _quick_checks(metadata: Dict[str, Any]) -> Tuple[bool, List[str]]:
+    """
+    Run the required field, importance and unique_id checks in one pass.
+
+    Reads each field once and gives the same messages as calling
+    validate_required_fields, validate_importance_level and
+    validate_unique_id_format in turn; a failing check's function still
+    builds its detailed message. A unique_id prefix mismatch is a warning
+    and does not make the metadata invalid.
+
+    Args:
+        metadata: Metadata dictionary
+
+    Returns:
+        Tuple of (all_valid: bool, messages: list)
+    """
+    unique_id = metadata.get("unique_id", "")
+    knowledge_type = metadata.get("type", "")
+    importance = metadata.get("importance")
+    all_valid = True
+
+    if metadata.keys() >= _REQUIRED_FIELD_SET:
+        required_message = _REQUIRED_FIELDS_OK
+    else:
+        all_valid = False
+        required_message = validate_required_fields(metadata)[1]
+
+    if isinstance(importance, str) and importance in _IMPORTANCE_LEVEL_SET:
+        importance_message = _IMPORTANCE_OK.format(importance)
+    else:
+        all_valid = False
+        importance_message = validate_importance_level(metadata)[1]
+
+    expected_prefix = _expected_unique_id_prefix(knowledge_type)
+    if expected_prefix and not (
+        isinstance(unique_id, str) and unique_id.startswith(expected_prefix)
+    ):
+        unique_id_message = validate_unique_id_format(metadata)[1]
+    else:
+        unique_id_message = _UNIQUE_ID_OK.format(knowledge_type)
+
+    return all_valid, [
+        f"Required Fields: {required_message}",
+        f"Importance Level: {importance_message}",
+        f"Unique ID Format: {unique_id_message}",
+    ]
+
+
+def _canonical_json(metadata: Dict[str, Any]) -> bytes:
+    """
+    Serialize plain JSON metadata with sorted keys, so equal metadata gives
+    equal bytes.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(metadata, option=orjson.OPT_SORT_KEYS)
+        except TypeError:
+            pass
+    return json.dumps(metadata, sort_keys=True, separators=(",", ":")).encode("utf-8")
 
 
 def run_all_validations(
@@ -243,6 +699,12 @@ def run_all_validations(
     """
     Run all validation checks on metadata.
 
+    Results are memoized on a SHA256 digest of the metadata's canonical JSON,
+    so revalidating unchanged metadata (e.g. in batch re-runs) skips the
+    checks. Only plain JSON data the size walk bounds under MAX_JSON_SIZE is
+    memoized; anything else (tuples, dates, oversized payloads) is checked
+    every time, since its serialization is lossy or too costly to build.
+
     Args:
         metadata: Metadata dictionary
         knowledge_type: Optional type override
@@ -250,24 +712,58 @@ def run_all_validations(
     Returns:
         Tuple of (all_valid: bool, messages: list)
     """
-    results = []
-    all_valid = True
+    try:
+        size_bounds = _json_size_bounds(metadata, 0, MAX_JSON_SIZE)
+    except ValueError:
+        # Rejected by the schema check, which reports why
+        return _run_validations(metadata, knowledge_type, None)
+    # A known bound implies plain JSON data; the checks report everything else
+    max_bound = size_bounds[1]
+    if (
+        max_bound is None
+        or max_bound > MAX_JSON_SIZE
+        or not (knowledge_type is None or isinstance(knowledge_type, str))
+    ):
+        return _run_validations(metadata, knowledge_type, size_bounds)
+
+    key = (knowledge_type, hashlib.sha256(_canonical_json(metadata)).digest())
+
+    cached = _validation_cache.get(key)
+    if cached is not None:
+        _validation_cache.move_to_end(key)
+        all_valid, messages = cached
+        return all_valid, list(messages)
+
+    all_valid, results = _run_validations(metadata, knowledge_type, size_bounds)
+    _validation_cache[key] = (all_valid, tuple(results))
+    if len(_validation_cache) > VALIDATION_CACHE_SIZE:
+        _validation_cache.popitem(last=False)
+    return all_valid, results
 
-    # Quick checks first
-    checks = [
-        ("Required Fields", validate_required_fields),
-        ("Importance Level", validate_importance_level),
-        ("Unique ID Format", validate_unique_id_format),
-    ]
 
-    for check_name, check_func in checks:
-        is_valid, message = check_func(metadata)
-        results.append(f"{check_name}: {message}")
-        if not is_valid and "ERROR" in message:
-            all_valid = False
+def clear_validation_cache() -> None:
+    """
+    Forget memoized run_all_validations results and loaded schemas.
+
+    Call after schema files change so the next validation reads them again.
+    """
+    _validation_cache.clear()
+    load_schema.cache_clear()
+    get_validator.cache_clear()
+    get_fast_validator.cache_clear()
+
+
+def _run_validations(
+    metadata: Dict[str, Any],
+    knowledge_type: Optional[str],
+    size_bounds: Optional[Tuple[int, Optional[int], bool]],
+) -> Tuple[bool, list]:
+    """Run the checks for run_all_validations without memoization."""
+    # Quick checks first
+    all_valid, results = _quick_checks(metadata)
 
     # Full schema validation
-    is_valid, message = validate_metadata(metadata, knowledge_type)
+    is_valid, message = _validate_metadata(metadata, knowledge_type, size_bounds)
     results.append(f"Schema Validation: {message}")
     if not is_valid:
         all_valid = False
@@ -275,12 +771,125 @@ def run_all_validations(
     return all_valid, results
 
 
+def _read_metadata_file(path: str) -> Any:
+    """
+    Read and parse a metadata JSON file.
+
+    Reads at most one byte past MAX_METADATA_FILE_SIZE, so an oversized file
+    is rejected before it is loaded or parsed.
+
+    Args:
+        path: Path to metadata JSON file
+
+    Returns:
+        Parsed JSON value
+
+    Raises:
+        OSError: If the file cannot be read (e.g. FileNotFoundError)
+        json.JSONDecodeError: If the file is not valid JSON
+        ValueError: If the file is larger than MAX_METADATA_FILE_SIZE
+    """
+    with open(path, "rb") as f:
+        data = f.read(MAX_METADATA_FILE_SIZE + 1)
+    if len(data) > MAX_METADATA_FILE_SIZE:
+        raise ValueError(
+            f"Metadata file too large (over {MAX_METADATA_FILE_SIZE:,} bytes): {path}"
+        )
+    return _json_loads(data)
+
+
+def _validate_file(path: str, knowledge_type: str = None) -> Tuple[bool, list]:
+    """Validate one metadata file for validate_files; file errors are messages."""
+    try:
+        metadata = _read_metadata_file(path)
+    except FileNotFoundError:
+        return False, [f"ERROR: Metadata file not found: {path}"]
+    except OSError as e:
+        return False, [f"ERROR: Cannot read metadata file: {e}"]
+    except json.JSONDecodeError as e:
+        return False, [f"ERROR: Invalid JSON in metadata file: {e}"]
+    except ValueError as e:
+        return False, [f"ERROR: {e}"]
+
+    if not isinstance(metadata, dict):
+        return False, ["ERROR: Metadata must be a JSON object"]
+    return run_all_validations(metadata, knowledge_type)
+
+
+def validate_files(
+    paths: Sequence[str], knowledge_type: str = None, max_workers: int = None
+) -> List[Tuple[bool, list]]:
+    """
+    Validate many metadata files, in worker processes for large batches.
+
+    Files are independent and validation is CPU-bound, so batches of
+    BATCH_PARALLEL_MIN_FILES or more are spread over a process pool; each
+    worker compiles the schema validators once and reuses them. Smaller
+    batches run in this process, where pool startup would cost more.
+
+    Args:
+        paths: Metadata JSON file paths
+        knowledge_type: Optional type override applied to every file
+        max_workers: Worker processes (default: one per CPU)
+
+    Returns:
+        (all_valid, messages) for each path, in the same order
+    """
+    check = partial(_validate_file, knowledge_type=knowledge_type)
+    if len(paths) < BATCH_PARALLEL_MIN_FILES:
+        return [check(path) for path in paths]
+
+    # Imported here so single-file runs and library callers skip its import
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(check, paths, chunksize=BATCH_CHUNK_SIZE))
+
+
+def _run_batch(pattern: str, knowledge_type: str = None, strict: bool = False) -> int:
+    """Validate every file matching pattern, print a report, return exit code."""
+    paths = sorted(glob.glob(pattern, recursive=True))
+    if not paths:
+        print(f"ERROR: No metadata files match: {pattern}")
+        return 1
+
+    results = validate_files(paths, knowledge_type)
+
+    print("\n" + "=" * 60)
+    print("BATCH METADATA VALIDATION RESULTS")
+    print("=" * 60 + "\n")
+
+    failed = 0
+    for path, (all_valid, messages) in zip(paths, results):
+        problems = [msg for msg in messages if "ERROR" in msg or "WARNING" in msg]
+        if not all_valid or (strict and problems):
+            failed += 1
+            print(f"❌ {path}")
+        else:
+            print(f"✅ {path}")
+        for message in problems:
+            print("   " + message.replace("\n", "\n   "))
+
+    print("\n" + "=" * 60)
+    print(f"{len(paths)} files: {len(paths) - failed} passed, {failed} failed")
+    return 1 if failed else 0
+
+
 def main():
     """Main CLI entry point."""
+    # Imported here so modules importing the validators skip its import cost
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Validate metadata against Qdrant MCP knowledge schemas"
     )
-    parser.add_argument("--metadata", required=True, help="Path to metadata JSON file")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--metadata", help="Path to metadata JSON file")
+    source.add_argument(
+        "--batch",
+        metavar="PATTERN",
+        help="Glob of metadata JSON files to validate, e.g. 'entries/**/*.json'",
+    )
     parser.add_argument(
         "--type",
         choices=ALLOWED_TYPES,
@@ -292,16 +901,26 @@ def main():
 
     args = parser.parse_args()
 
+    if args.batch:
+        sys.exit(_run_batch(args.batch, args.type, args.strict))
+
     # Load metadata
     try:
-        with open(args.metadata, "r") as f:
-            metadata = json.load(f)
+        metadata = _read_metadata_file(args.metadata)
     except FileNotFoundError:
         print(f"ERROR: Metadata file not found: {args.metadata}")
         sys.exit(1)
     except json.JSONDecodeError as e:
         print(f"ERROR: Invalid JSON in metadata file: {e}")
         sys.exit(1)
+    except ValueError as e:
+        # Security: oversized file, rejected before parsing
+        print(f"ERROR: {e}")
+        sys.exit(1)
+
+    if not isinstance(metadata, dict):
+        print("ERROR: Metadata must be a JSON object")
+        sys.exit(1)
 
     # Run validations
     all_valid, messages = run_all_validations(metadata, args.type)